@@ -19,6 +19,7 @@ datas = [
     *collect_data_files('lightning_fabric'),
     *collect_data_files('speechbrain'),
     *collect_data_files('pyannote'),
+    *collect_data_files('silero_vad'),
     *collect_data_files('tiktoken'),
     *collect_data_files('transformers')
 ]
@@ -3,6 +3,9 @@ import logging
 import os
 import sys
 import tempfile
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 from moviepy.editor import VideoFileClip
 import torchaudio
 import traceback
@@ -29,21 +32,75 @@ class TqdmLogStream:
         self.linebuf = ''
 
     def write(self, buf):
-        # Write each line to the log
-        for line in buf.rstrip().splitlines():
+        # Buffer partial writes and log one record per completed line, instead of one per write.
+        self.linebuf += buf
+        *lines, self.linebuf = self.linebuf.split('\n')
+        for line in lines:
+            line = self._latest_redraw(line)
             # Don't log empty lines
-            if line.strip():
-                self.logger.log(self.level, line.rstrip())
+            if line:
+                self.logger.log(self.level, line)
+        # tqdm redraws its bar in place with carriage returns; only the latest redraw is worth keeping.
+        # The '\r' after it stays in the buffer so the next redraw doesn't run on from it.
+        if '\r' in self.linebuf:
+            done, pending = self.linebuf.rsplit('\r', 1)
+            self.linebuf = self._latest_redraw(done) + '\r' + pending
+
+    @staticmethod
+    def _latest_redraw(line):
+        """Returns the last non-empty carriage-return-separated part of a line."""
+        parts = [part.rstrip() for part in line.split('\r') if part.strip()]
+        return parts[-1] if parts else ''
 
     def flush(self):
         # The flush method is required for compatibility with stream protocols.
+        # tqdm calls it after every redraw, so it doesn't log the buffer; close() does.
         pass
 
-VIDEO_EXTENSIONS = ['.mp4', '.mkv', 'avi', '.mov', '.flv', '.wmv']
+    def close(self):
+        """Logs the last redraw still waiting for a newline."""
+        line = self._latest_redraw(self.linebuf)
+        self.linebuf = ''
+        if line:
+            self.logger.log(self.level, line)
+
+class PipeProgressReporter:
+    """
+    Progress callback handed to AudioProcessor and its handlers. Forwards progress
+    and status updates to the UI process through the worker's end of the result pipe.
+    Intermediate progress is rate-limited; completion and status changes always go through.
+    """
+    MIN_INTERVAL_NS = 100_000_000  # 100 ms, i.e. at most 10 intermediate updates per second
+
+    def __init__(self, conn):
+        self.conn = conn
+        self._last_emit_ns = 0
+        self._last_message = None
+
+    def __call__(self, message, percentage=None):
+        now = time.monotonic_ns()
+        status_changed = bool(message) and message != self._last_message
+        if (not status_changed and percentage is not None and percentage < 100
+                and now - self._last_emit_ns < self.MIN_INTERVAL_NS):
+            return
+        self._last_emit_ns = now
+        if percentage is not None: self.conn.send((constants.MSG_TYPE_PROGRESS, percentage))
+        if status_changed:
+            self._last_message = message
+            self.conn.send((constants.MSG_TYPE_STATUS, message))
+
+# UI model key -> Whisper model name. Read-only and shared, so it is built once per process.
+_MODEL_MAP = types.MappingProxyType({sys.intern(k): sys.intern(v) for k, v in {
+    "tiny": "tiny", "base": "base", "small": "small", "medium": "medium",
+    "large (recommended)": "large", "turbo": "small",
+}.items()})
+
+def _map_ui_model_key_to_whisper_name(ui_model_key: str) -> str:
+    return _MODEL_MAP.get(ui_model_key, "large")
 
 def _is_video_file(file_path):
     """Checks if a file is a video based on its extension."""
-    return any(file_path.lower().endswith(ext) for ext in VIDEO_EXTENSIONS)
+    return os.path.splitext(file_path)[1].lower() in constants.VIDEO_EXTENSIONS
 
 def _extract_audio(video_path):
     """Extracts audio from a video file."""
@@ -58,7 +115,17 @@ def _extract_audio(video_path):
         logger.error(f"Failed to extract audio from {video_path}: {e}", exc_info=True)
         raise
 
-def processing_worker_function(queue, file_paths, options, cache_dir, dest_folder=None, ffmpeg_path=None):
+def _prepare_audio(file_path):
+    """
+    Returns (audio_to_process, temp_audio_path) for a file, extracting the audio track
+    of video files into a temporary WAV that the caller must remove.
+    """
+    if _is_video_file(file_path):
+        temp_audio_path = _extract_audio(file_path)
+        return temp_audio_path, temp_audio_path
+    return file_path, None
+
+def processing_worker_function(conn, file_paths, options, cache_dir, dest_folder=None, ffmpeg_path=None):
     """
     The definitive worker function. Includes a global fix for the tqdm crash
     by redirecting console output to a log file.
@@ -96,14 +163,7 @@ def processing_worker_function(queue, file_paths, options, cache_dir, dest_folde
         worker_logger.error(f"Failed to set torchaudio backend: {e}")
 
     try:
-        def progress_callback(message, percentage=None):
-            # This line and the one below now work
-            if percentage is not None: queue.put((constants.MSG_TYPE_PROGRESS, percentage))
-            if message: queue.put((constants.MSG_TYPE_STATUS, message))
-
-        def _map_ui_model_key_to_whisper_name(ui_model_key: str) -> str:
-            mapping = {"tiny": "tiny", "base": "base", "small": "small", "medium": "medium", "large (recommended)": "large", "turbo": "small"}
-            return mapping.get(ui_model_key, "large")
+        progress_callback = PipeProgressReporter(conn)
 
         processor_config = {
             'huggingface': {'use_auth_token': 'yes' if options['enable_diarization'] else 'no', 'hf_token': options['hf_token']},
@@ -117,48 +177,74 @@ def processing_worker_function(queue, file_paths, options, cache_dir, dest_folde
             cache_dir=cache_dir
         )
         
-        all_results = []
-        for idx, file_path in enumerate(file_paths):
-            # This block now works because all constants are defined
-            queue.put((constants.MSG_TYPE_BATCH_FILE_START, {
-                'filename': os.path.basename(file_path),
-                'current_idx': idx + 1,
-                'total_files': len(file_paths)
-            }))
-            
-            audio_to_process = file_path
-            temp_audio_path = None
-            try:
-                if _is_video_file(file_path):
-                    progress_callback("Extracting audio...", 0)
-                    temp_audio_path = _extract_audio(file_path)
-                    audio_to_process = temp_audio_path
-
-                result = audio_processor.process_audio(audio_to_process)
-                result.source_file = file_path
-
-                if result.status == constants.STATUS_SUCCESS and len(file_paths) > 1 and dest_folder:
-                    model_name_key = options["model_key"].split(" ")[0]
-                    base_name, _ = os.path.splitext(os.path.basename(file_path))
-                    output_filename = f"{base_name}_{model_name_key}_transcription.txt"
-                    save_path = os.path.join(dest_folder, output_filename)
-                    AudioProcessor.save_to_txt(save_path, result.data, result.is_plain_text_output)
-                    result.output_path = save_path
-                all_results.append(result)
-
-            except Exception as e:
-                full_traceback = traceback.format_exc()
-                error_msg = f"Failed to process {os.path.basename(file_path)}:\n{full_traceback}"
-                worker_logger.error(f"Captured full traceback for file {file_path}:\n{full_traceback}")
-                all_results.append(ProcessedAudioResult(status=constants.STATUS_ERROR, message=error_msg, source_file=file_path))
-            
-            finally:
-                if temp_audio_path and os.path.exists(temp_audio_path):
-                    os.remove(temp_audio_path)
+        # Batch results are saved straight to the destination folder; a single file is saved from the UI.
+        save_to_dest_folder = len(file_paths) > 1 and bool(dest_folder)
+        model_name_key = options["model_key"].split(" ")[0]
+        # (basename, stem) per input file, computed once instead of in every branch of the loop.
+        file_names = [(base, os.path.splitext(base)[0]) for base in map(os.path.basename, file_paths)]
+        # One slot per input file, filled by index so the results keep the input order.
+        all_results = [None] * len(file_paths)
+        # The transcription model is not reentrant, so files are still transcribed one at a time,
+        # but the next file's audio extraction runs in the background while the current one is processed,
+        # and finished transcripts are written out on a separate pool while later files are transcribed.
+        pending_saves = []
+        with ThreadPoolExecutor(max_workers=1) as prefetcher, ThreadPoolExecutor(max_workers=4) as saver:
+            next_audio = prefetcher.submit(_prepare_audio, file_paths[0]) if file_paths else None
+            for idx, file_path in enumerate(file_paths):
+                base_filename, file_stem = file_names[idx]
+                # This block now works because all constants are defined
+                conn.send((constants.MSG_TYPE_BATCH_FILE_START, {
+                    'filename': base_filename,
+                    'current_idx': idx + 1,
+                    'total_files': len(file_paths)
+                }))
+
+                current_audio = next_audio
+                next_audio = prefetcher.submit(_prepare_audio, file_paths[idx + 1]) if idx + 1 < len(file_paths) else None
+
+                temp_audio_path = None
+                try:
+                    if _is_video_file(file_path) and not current_audio.done():
+                        progress_callback("Extracting audio...", 0)
+                    audio_to_process, temp_audio_path = current_audio.result()
+
+                    result = audio_processor.process_audio(audio_to_process)
+                    result.source_file = file_path
+
+                    if save_to_dest_folder and result.status == constants.STATUS_SUCCESS:
+                        output_filename = f"{file_stem}_{model_name_key}_transcription.txt"
+                        save_path = os.path.join(dest_folder, output_filename)
+                        result.output_path = save_path
+                        pending_saves.append((idx, saver.submit(AudioProcessor.save_to_txt, save_path, result.data, result.is_plain_text_output)))
+                    all_results[idx] = result
+
+                except Exception as e:
+                    full_traceback = traceback.format_exc()
+                    error_msg = f"Failed to process {base_filename}:\n{full_traceback}"
+                    worker_logger.error(f"Captured full traceback for file {file_path}:\n{full_traceback}")
+                    all_results[idx] = ProcessedAudioResult(status=constants.STATUS_ERROR, message=error_msg, source_file=file_path)
+
+                finally:
+                    if temp_audio_path and os.path.exists(temp_audio_path):
+                        os.remove(temp_audio_path)
+
+            # Every save must have landed (or failed) before the batch is reported as done.
+            for idx, save_future in pending_saves:
+                try:
+                    save_future.result()
+                except Exception as e:
+                    file_path = file_paths[idx]
+                    worker_logger.error(f"Failed to save transcription for {file_path}: {e}", exc_info=True)
+                    all_results[idx] = ProcessedAudioResult(status=constants.STATUS_ERROR, message=f"Failed to save transcription for {file_names[idx][0]}: {e}", source_file=file_path)
         
-        queue.put((constants.MSG_TYPE_BATCH_COMPLETED, {'all_results': all_results}))
+        conn.send((constants.MSG_TYPE_BATCH_COMPLETED, {'all_results': all_results}))
 
     except Exception:
         full_traceback = traceback.format_exc()
         worker_logger.error(f"Critical unhandled error in worker:\n{full_traceback}")
-        queue.put((constants.MSG_TYPE_BATCH_COMPLETED, {'all_results': [ProcessedAudioResult(status=constants.STATUS_ERROR, message=f"A critical worker error occurred:\n{full_traceback}")]}))
\ No newline at end of file
+        conn.send((constants.MSG_TYPE_BATCH_COMPLETED, {'all_results': [ProcessedAudioResult(status=constants.STATUS_ERROR, message=f"A critical worker error occurred:\n{full_traceback}")]}))
+    finally:
+        # Don't lose a progress bar's final redraw that never got its newline.
+        for stream in (sys.stdout, sys.stderr):
+            if isinstance(stream, TqdmLogStream):
+                stream.close()
\ No newline at end of file
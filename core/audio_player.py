@@ -19,6 +19,58 @@ def _is_video_file(file_path):
         return False
     return file_path.lower().endswith(VIDEO_EXTENSIONS)
 
+def decode_media_file(file_path):
+    """
+    Decodes an audio or video file for playback. Does no Qt work, so it can run off the GUI thread.
+    Returns (int16 stereo frames, playback sample rate, normalized mono waveform list, duration in seconds).
+    """
+    audio_data_float = None
+    source_sr = TARGET_PLAYBACK_SR
+
+    if _is_video_file(file_path):
+        logger.info(f"Detected video file, extracting audio in memory: {file_path}")
+        with VideoFileClip(file_path) as video:
+            source_sr = video.audio.fps
+            # --- THIS IS THE FINAL, CORRECTED LOGIC ---
+            # 1. Provide the required `chunksize` to `iter_chunks`.
+            # 2. Use `np.concatenate` to join the chunks into a single stream.
+            audio_chunks = [chunk for chunk in video.audio.iter_chunks(chunksize=source_sr)]
+            audio_data_float = np.concatenate(audio_chunks)
+
+    else:
+        logger.info(f"Detected audio file, loading directly: {file_path}")
+        audio_data_float, source_sr = sf.read(file_path, dtype='float32')
+
+    # Ensure data is 1D (mono) for initial processing.
+    if audio_data_float.ndim > 1:
+        mono_for_viz = audio_data_float.mean(axis=1)
+    else:
+        mono_for_viz = audio_data_float
+
+    playback_sr = source_sr
+    if source_sr != TARGET_PLAYBACK_SR:
+        logger.info(f"Resampling audio from {source_sr}Hz to {TARGET_PLAYBACK_SR}Hz")
+        num_frames = int(len(mono_for_viz) * TARGET_PLAYBACK_SR / source_sr)
+        mono_for_playback = signal.resample(mono_for_viz, num_frames)
+        playback_sr = TARGET_PLAYBACK_SR
+    else:
+        mono_for_playback = mono_for_viz
+    
+    # Prepare data for PyAudio worker: stereo, 16-bit integer
+    if mono_for_playback.ndim == 1:
+        mono_for_playback_stereo = np.stack([mono_for_playback, mono_for_playback], axis=-1)
+    else: # Already stereo, no need to stack
+        mono_for_playback_stereo = mono_for_playback
+
+    audio_data_int16 = (mono_for_playback_stereo * 32767).astype(np.int16)
+    
+    # Prepare data for waveform visualization
+    max_val = np.max(np.abs(mono_for_viz))
+    normalized_waveform = (mono_for_viz / max_val if max_val > 0 else mono_for_viz).tolist()
+    
+    duration = len(mono_for_playback) / float(playback_sr)
+    return audio_data_int16, playback_sr, normalized_waveform, duration
+
 class _PlayerWorker(QObject):
     position_changed = Signal(float)
     finished = Signal()
@@ -78,6 +130,15 @@ class _PlayerWorker(QObject):
         self._stop_requested = True
         self._is_paused = False
 
+    @Slot()
+    def unload(self):
+        """Stops playback and drops the loaded audio; the stream and PyAudio instance are kept."""
+        self._stop()
+        self._audio_data = None
+        self._total_frames = 0
+        self._current_frame = 0
+        self._sample_rate = 0
+
     @Slot(float)
     def set_position(self, seconds):
         if self._sample_rate > 0:
@@ -122,7 +183,7 @@ class _PlayerWorker(QObject):
             self.stream.close()
         self.stream = None
         self._stop_requested = False
-        if self._current_frame >= self._total_frames:
+        if self._total_frames and self._current_frame >= self._total_frames:
             self.finished.emit()
         self.state_changed.emit(False)
 
@@ -142,6 +203,7 @@ class AudioPlayer(QObject):
     _play_requested = Signal()
     _pause_requested = Signal()
     _position_set_requested = Signal(float)
+    _unload_requested = Signal()
 
     def __init__(self):
         super().__init__()
@@ -157,6 +219,7 @@ class AudioPlayer(QObject):
         self._play_requested.connect(self.worker.play)
         self._pause_requested.connect(self.worker.pause)
         self._position_set_requested.connect(self.worker.set_position)
+        self._unload_requested.connect(self.worker.unload)
         self.worker.position_changed.connect(self._on_progress)
         self.worker.finished.connect(self._on_finished)
         self.worker.state_changed.connect(self._on_state_changed)
@@ -166,63 +229,30 @@ class AudioPlayer(QObject):
         self.thread.start()
 
     def load_file(self, file_path):
+        self.is_ready.emit(False)
         try:
-            self.is_ready.emit(False)
-            audio_data_float = None
-            source_sr = TARGET_PLAYBACK_SR
-
-            if _is_video_file(file_path):
-                logger.info(f"Detected video file, extracting audio in memory: {file_path}")
-                with VideoFileClip(file_path) as video:
-                    source_sr = video.audio.fps
-                    # --- THIS IS THE FINAL, CORRECTED LOGIC ---
-                    # 1. Provide the required `chunksize` to `iter_chunks`.
-                    # 2. Use `np.concatenate` to join the chunks into a single stream.
-                    audio_chunks = [chunk for chunk in video.audio.iter_chunks(chunksize=source_sr)]
-                    audio_data_float = np.concatenate(audio_chunks)
-
-            else:
-                logger.info(f"Detected audio file, loading directly: {file_path}")
-                audio_data_float, source_sr = sf.read(file_path, dtype='float32')
-
-            # Ensure data is 1D (mono) for initial processing.
-            if audio_data_float.ndim > 1:
-                mono_for_viz = audio_data_float.mean(axis=1)
-            else:
-                mono_for_viz = audio_data_float
-
-            playback_sr = source_sr
-            if source_sr != TARGET_PLAYBACK_SR:
-                logger.info(f"Resampling audio from {source_sr}Hz to {TARGET_PLAYBACK_SR}Hz")
-                num_frames = int(len(mono_for_viz) * TARGET_PLAYBACK_SR / source_sr)
-                mono_for_playback = signal.resample(mono_for_viz, num_frames)
-                playback_sr = TARGET_PLAYBACK_SR
-            else:
-                mono_for_playback = mono_for_viz
-            
-            # Prepare data for PyAudio worker: stereo, 16-bit integer
-            if mono_for_playback.ndim == 1:
-                mono_for_playback_stereo = np.stack([mono_for_playback, mono_for_playback], axis=-1)
-            else: # Already stereo, no need to stack
-                mono_for_playback_stereo = mono_for_playback
-
-            audio_data_int16 = (mono_for_playback_stereo * 32767).astype(np.int16)
-            
-            # Prepare data for waveform visualization
-            max_val = np.max(np.abs(mono_for_viz))
-            self._normalized_waveform = (mono_for_viz / max_val if max_val > 0 else mono_for_viz).tolist()
-            
-            self._duration = len(mono_for_playback) / float(playback_sr)
-            
-            self._load_requested.emit(audio_data_int16, playback_sr)
-            self.is_ready.emit(True)
-            logger.info(f"Successfully loaded. Duration: {self._duration:.2f}s, Playback SR: {playback_sr}Hz")
-            return True
-            
+            decoded = decode_media_file(file_path)
         except Exception as e:
             logger.exception("Error loading audio/video file.")
             self.error.emit(f"Failed to load media file: {e}")
             return False
+        self.load_decoded(decoded)
+        return True
+
+    def load_decoded(self, decoded):
+        """Hands media already decoded by decode_media_file (possibly on another thread) to the playback worker."""
+        audio_data_int16, playback_sr, self._normalized_waveform, self._duration = decoded
+        self._load_requested.emit(audio_data_int16, playback_sr)
+        self.is_ready.emit(True)
+        logger.info(f"Successfully loaded. Duration: {self._duration:.2f}s, Playback SR: {playback_sr}Hz")
+
+    def reset(self):
+        """Returns the player to its empty state so it can be reused for another file, keeping its thread and signal connections."""
+        self._unload_requested.emit()
+        self._duration = 0.0
+        self._current_time = 0.0
+        self._normalized_waveform = []
+        self.is_playing = False
 
     def play(self): self._play_requested.emit()
     def pause(self): self._pause_requested.emit()
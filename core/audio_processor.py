@@ -7,16 +7,21 @@ import traceback # Import traceback module
 
 from utils import constants
 from .diarization_handler import DiarizationHandler
-from .transcription_handler import TranscriptionHandler
+from .transcription_handler import TranscriptionHandler, SAMPLE_RATE
 
 logger = logging.getLogger(__name__)
 
+# Write buffer used when saving transcripts.
+SAVE_BUFFER_SIZE = 1 << 20
+
 class ProcessedAudioResult:
-    def __init__(self, status, data=None, message=None, is_plain_text_output=False):
+    def __init__(self, status, data=None, message=None, is_plain_text_output=False, source_file=None, output_path=None):
         self.status = status 
         self.data = data
         self.message = message
         self.is_plain_text_output = is_plain_text_output
+        self.source_file = source_file
+        self.output_path = output_path
 
 class AudioProcessor:
     def __init__(self, config: dict, progress_callback=None, 
@@ -92,13 +97,17 @@ class AudioProcessor:
             return ProcessedAudioResult(status=constants.STATUS_ERROR, message="Essential transcription model not loaded.")
 
         try:
+            # Decode the audio once and share the waveform between diarization and transcription.
+            waveform = self.transcription_handler.load_waveform(audio_path)
+            sample_rate = SAMPLE_RATE
+
             diarization_result_obj = None
             if diarization_will_be_attempted:
                 self.progress_callback("Diarization starting...", 25) if self.progress_callback else None
-                diarization_result_obj = self.diarization_handler.diarize(audio_path)
+                diarization_result_obj = self.diarization_handler.diarize(audio_path, waveform=waveform, sample_rate=sample_rate)
             
             self.progress_callback(f"Transcription starting...", 50) if self.progress_callback else None
-            transcription_output_dict = self.transcription_handler.transcribe(audio_path)
+            transcription_output_dict = self.transcription_handler.transcribe(audio_path, waveform=waveform, sample_rate=sample_rate)
 
             if not transcription_output_dict or 'segments' not in transcription_output_dict or not transcription_output_dict['segments']:
                 return ProcessedAudioResult(status=constants.STATUS_EMPTY, message="No speech detected.")
@@ -173,7 +182,10 @@ class AudioProcessor:
         return lines
 
     @staticmethod
-    def save_to_txt(output_path, data, is_plain_text):
-        with open(output_path, 'w', encoding='utf-8') as f:
-            if is_plain_text: f.write(str(data))
-            else: f.write('\n'.join(data))
\ No newline at end of file
+    def save_to_txt(path, data, is_plain_text):
+        """
+        Saves a transcript (plain text or a list of lines) to a path. The file is opened with
+        a 1 MiB buffer and written in one call, so long transcripts reach the disk in a few large writes.
+        """
+        with open(path, 'w', encoding='utf-8', buffering=SAVE_BUFFER_SIZE) as f:
+            f.write(str(data) if is_plain_text else '\n'.join(data))
\ No newline at end of file
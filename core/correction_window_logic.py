@@ -3,6 +3,7 @@ import logging
 import re
 import uuid
 from tkinter import messagebox
+from sortedcontainers import SortedSet
 try:
     from utils import constants
 except ImportError:
@@ -15,7 +16,8 @@ logger = logging.getLogger(__name__)
 
 class SegmentManager:
     def __init__(self, parent_window_for_dialogs=None):
-        self.segments = []; self.speaker_map = {}; self.unique_speaker_labels = set(); self.parent_window = parent_window_for_dialogs
+        # unique_speaker_labels is kept sorted as labels are added, so dialogs can list it without re-sorting.
+        self.segments = []; self.speaker_map = {}; self.unique_speaker_labels = SortedSet(); self.parent_window = parent_window_for_dialogs
         self.pattern_start_end_ts_speaker = re.compile(r"^\[(\d{2}:\d{2}\.\d{3})\s*-\s*(\d{2}:\d{2}\.\d{3})\]\s*([^:]+?):\s*(.*)$")
         self.pattern_start_end_ts_only = re.compile(r"^\[(\d{2}:\d{2}\.\d{3})\s*-\s*(\d{2}:\d{2}\.\d{3})\]\s*(.*)$")
         self.pattern_start_ts_speaker = re.compile(r"^\[(\d{2}:\d{2}\.\d{3})\]\s*([^:]+?):\s*(.*)$")
@@ -205,29 +207,24 @@ class SegmentManager:
     def merge_multiple_segments(self, segment_ids: list[str]) -> str | None:
         if len(segment_ids) < 2: return None
         id_to_index = {seg["id"]: i for i, seg in enumerate(self.segments)}
-        sorted_ids = sorted(segment_ids, key=lambda seg_id: id_to_index.get(seg_id, float('inf')))
-        target_segment_id = sorted_ids[0]; target_segment = self.get_segment_by_id(target_segment_id)
-        if not target_segment: return None
+        # Resolve ids through the index map built above rather than a list scan per id.
+        sorted_ids = sorted((seg_id for seg_id in segment_ids if seg_id in id_to_index), key=id_to_index.__getitem__)
+        if not sorted_ids: return None
+        target_segment_id = sorted_ids[0]; target_segment = self.segments[id_to_index[target_segment_id]]
         ids_to_remove = set()
+        # Texts are joined once at the end instead of re-concatenating the growing text per segment.
+        texts = [target_segment['text']]
         for i in range(1, len(sorted_ids)):
             segment_to_merge_id = sorted_ids[i]
-            segment_to_merge = self.get_segment_by_id(segment_to_merge_id)
-            if not segment_to_merge: continue
-
-            target_text = target_segment['text']
-            merge_text = segment_to_merge['text']
-
-            if target_text == constants.EMPTY_SEGMENT_PLACEHOLDER: target_text = ""
-            if merge_text == constants.EMPTY_SEGMENT_PLACEHOLDER: merge_text = ""
-            
-            sep = " " if target_text and merge_text else "";
-            merged_text = target_text + sep + merge_text
-            target_segment["text"] = merged_text if merged_text else constants.EMPTY_SEGMENT_PLACEHOLDER
+            segment_to_merge = self.segments[id_to_index[segment_to_merge_id]]
+            texts.append(segment_to_merge['text'])
 
             if segment_to_merge.get("end_time") is not None:
                  target_segment["end_time"] = segment_to_merge["end_time"]
                  if segment_to_merge.get("has_explicit_end_time"): target_segment["has_explicit_end_time"] = True
             ids_to_remove.add(segment_to_merge_id)
+        merged_text = " ".join(t for t in texts if t and t != constants.EMPTY_SEGMENT_PLACEHOLDER)
+        target_segment["text"] = merged_text if merged_text else constants.EMPTY_SEGMENT_PLACEHOLDER
         self.segments = [seg for seg in self.segments if seg["id"] not in ids_to_remove]
         return target_segment_id
         
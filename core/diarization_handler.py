@@ -50,23 +50,24 @@ class DiarizationHandler:
         self._report_progress("Loading diarization model (may download)...", 0)
         
         # --- MODIFIED CACHE LOGIC ---
-        # The pyannote library primarily uses the HF_HUB_CACHE environment variable.
-        # We'll set it here to redirect its cache just for this operation.
-        original_cache = os.environ.get('HF_HUB_CACHE')
+        # The cache directory is passed straight to pyannote instead of temporarily
+        # rewriting HF_HUB_CACHE, which is process-global and not thread-safe.
+        cache_kwargs = {}
         if self.cache_dir:
             try:
                 # Models will be stored in a 'pyannote' subdirectory of the main cache folder.
                 pyannote_cache_path = os.path.join(self.cache_dir, "pyannote")
                 os.makedirs(pyannote_cache_path, exist_ok=True)
-                os.environ['HF_HUB_CACHE'] = pyannote_cache_path
-                logger.info(f"Set HF_HUB_CACHE for pyannote to: {pyannote_cache_path}")
+                cache_kwargs['cache_dir'] = pyannote_cache_path
+                logger.info(f"Using pyannote cache directory: {pyannote_cache_path}")
             except OSError as e:
                 logger.error(f"Could not create pyannote cache directory. It will use the default. Error: {e}")
 
         try:
             pipeline = Pipeline.from_pretrained(
                 "pyannote/speaker-diarization-3.1",
-                use_auth_token=self.hf_token
+                use_auth_token=self.hf_token,
+                **cache_kwargs
             )
             pipeline.to(self.device)
             logger.info("DiarizationHandler: pyannote.audio pipeline loaded successfully.")
@@ -80,25 +81,23 @@ class DiarizationHandler:
                  logger.error("Got a 401 Client Error. This strongly indicates the Hugging Face token is invalid or expired.")
                  self._report_progress("Diarization Error: Invalid Hugging Face token.", 0)
             return None
-        finally:
-            # Restore the original environment variable if it existed.
-            if original_cache:
-                os.environ['HF_HUB_CACHE'] = original_cache
-            elif 'HF_HUB_CACHE' in os.environ:
-                # If we set it and it didn't exist before, we can unset it.
-                del os.environ['HF_HUB_CACHE']
-            logger.info("Restored original HF_HUB_CACHE environment.")
 
-
-    def diarize(self, audio_path: str):
-        """Performs speaker diarization on the given audio file."""
+    def diarize(self, audio_path: str, waveform=None, sample_rate: int = None):
+        """
+        Performs speaker diarization on the given audio file.
+        If an already decoded waveform is given, it is passed to pyannote in memory instead of decoding the file again.
+        """
         if not self.is_model_loaded():
             logger.error("Cannot diarize: pipeline not loaded.")
             return None
         
         logger.info(f"DiarizationHandler: Starting diarization for {audio_path}")
         try:
-            diarization_result = self.pipeline(audio_path)
+            audio_input = audio_path
+            if waveform is not None:
+                # pyannote expects a (channel, time) tensor.
+                audio_input = {"waveform": waveform if waveform.dim() > 1 else waveform.unsqueeze(0), "sample_rate": sample_rate}
+            diarization_result = self.pipeline(audio_input)
             logger.info("DiarizationHandler: Diarization completed successfully.")
             return diarization_result
         except Exception as e:
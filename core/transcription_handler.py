@@ -1,12 +1,19 @@
 # core/transcription_handler.py
+import bisect
 import logging
 import os
+import numpy as np
+import torch
+import torchaudio
 import whisper
 
 logger = logging.getLogger(__name__)
 
+# Whisper always works on 16 kHz mono audio.
+SAMPLE_RATE = whisper.audio.SAMPLE_RATE
+
 class TranscriptionHandler:
-    def __init__(self, model_name, device, progress_callback=None, cache_dir=None):
+    def __init__(self, model_name, device, progress_callback=None, cache_dir=None, vad_filter=True):
         """
         Initializes the TranscriptionHandler.
 
@@ -15,11 +22,15 @@ class TranscriptionHandler:
             device (str): The device to run the model on ('cpu' or 'cuda').
             progress_callback (function, optional): A callback for reporting progress.
             cache_dir (str, optional): The root directory for caching models.
+            vad_filter (bool, optional): Run Silero-VAD first and only send speech to Whisper.
         """
         self.model_name = model_name
         self.device = device
         self.progress_callback = progress_callback
         self.cache_dir = cache_dir  # Store the cache directory
+        self.vad_filter = vad_filter
+        self._vad = None  # (model, get_speech_timestamps), loaded on first use
+        self._vad_unavailable = False
         self.model = self._load_model()
 
     def _report_progress(self, message: str, percentage: int = None):
@@ -67,12 +78,101 @@ class TranscriptionHandler:
             self._report_progress(f"Error loading model: {e}", 0)
             raise
 
-    def transcribe(self, audio_path: str):
-        """Transcribes the audio file."""
-        logger.info(f"TranscriptionHandler: Starting transcription for {audio_path}")
+    def _load_vad_model(self):
+        """
+        Loads the Silero-VAD model once from the pinned silero-vad package, which ships the
+        model weights itself, so nothing is downloaded or fetched from GitHub at runtime.
+        If it cannot be loaded, VAD is disabled and the full audio is transcribed.
+        """
+        if self._vad is None and not self._vad_unavailable:
+            try:
+                from silero_vad import load_silero_vad, get_speech_timestamps
+                self._vad = (load_silero_vad(), get_speech_timestamps)
+                logger.info("TranscriptionHandler: Silero-VAD model loaded.")
+            except Exception as e:
+                logger.warning(f"Could not load Silero-VAD, transcribing without VAD filter. Error: {e}")
+                self._vad_unavailable = True
+        return self._vad
+
+    def _get_speech_chunks(self, audio):
+        """Returns the speech regions of the audio as a list of {'start', 'end'} sample indices, or None if VAD is unavailable."""
+        vad = self._load_vad_model()
+        if vad is None:
+            return None
+        model, get_speech_timestamps = vad
         try:
+            return get_speech_timestamps(torch.from_numpy(audio), model, sampling_rate=SAMPLE_RATE)
+        except Exception as e:
+            logger.warning(f"Silero-VAD failed, transcribing without VAD filter. Error: {e}")
+            return None
+
+    @staticmethod
+    def _restore_original_timeline(segments, speech_chunks):
+        """Maps segment times from the stitched speech-only audio back onto the original audio."""
+        stitched_starts, original_starts = [], []
+        stitched_pos = 0.0
+        for chunk in speech_chunks:
+            stitched_starts.append(stitched_pos)
+            original_starts.append(chunk['start'] / SAMPLE_RATE)
+            stitched_pos += (chunk['end'] - chunk['start']) / SAMPLE_RATE
+
+        def to_original(t, find=bisect.bisect_right):
+            i = max(0, find(stitched_starts, t) - 1)
+            return original_starts[i] + (t - stitched_starts[i])
+
+        for segment in segments:
+            segment['start'] = to_original(segment['start'])
+            # An end on a chunk seam belongs to the chunk it closes, not the next one.
+            segment['end'] = to_original(segment['end'], bisect.bisect_left)
+
+    @staticmethod
+    def load_waveform(audio_path: str) -> torch.Tensor:
+        """Decodes the audio file once into a 16 kHz mono float32 tensor that can be shared with diarization."""
+        return torch.from_numpy(whisper.load_audio(audio_path))
+
+    def _prepare_audio(self, audio_path, waveform, sample_rate):
+        """Returns 16 kHz mono float32 samples, decoding the file only when no waveform was supplied."""
+        if waveform is None:
+            return whisper.load_audio(audio_path)
+        waveform = waveform.float()
+        if waveform.dim() > 1:
+            waveform = waveform.mean(dim=0)
+        if sample_rate and sample_rate != SAMPLE_RATE:
+            waveform = torchaudio.functional.resample(waveform, sample_rate, SAMPLE_RATE)
+        return waveform.cpu().numpy()
+
+    def _run_whisper(self, audio):
+        """Runs Whisper, in FP16 with autocast on CUDA and in FP32 on the CPU."""
+        device_type = torch.device(self.device).type
+        use_fp16 = device_type == "cuda"
+        with torch.autocast(device_type=device_type, dtype=torch.float16, enabled=use_fp16):
             # The verbose parameter prints detailed progress to the console, which can be useful for debugging.
-            result = self.model.transcribe(audio_path, verbose=False)
+            return self.model.transcribe(audio, verbose=False, fp16=use_fp16)
+
+    def transcribe(self, audio_path: str, waveform: torch.Tensor = None, sample_rate: int = None):
+        """
+        Transcribes the audio file, skipping silent regions when the VAD filter is enabled.
+        If an already decoded waveform is given, the file is not decoded again.
+        """
+        logger.info(f"TranscriptionHandler: Starting transcription for {audio_path}")
+        try:
+            if waveform is None and not self.vad_filter:
+                result = self._run_whisper(audio_path)
+                logger.info("TranscriptionHandler: Transcription completed successfully.")
+                return result
+
+            audio = self._prepare_audio(audio_path, waveform, sample_rate)
+            speech_chunks = self._get_speech_chunks(audio) if self.vad_filter else None
+            if speech_chunks is None:
+                result = self._run_whisper(audio)
+            elif not speech_chunks:
+                logger.info("TranscriptionHandler: VAD found no speech in the audio.")
+                return {"text": "", "segments": [], "language": None}
+            else:
+                speech_audio = np.concatenate([audio[c['start']:c['end']] for c in speech_chunks])
+                logger.info(f"TranscriptionHandler: VAD kept {len(speech_audio) / SAMPLE_RATE:.1f}s of {len(audio) / SAMPLE_RATE:.1f}s of audio.")
+                result = self._run_whisper(speech_audio)
+                self._restore_original_timeline(result['segments'], speech_chunks)
             logger.info("TranscriptionHandler: Transcription completed successfully.")
             return result
         except Exception as e:
@@ -1,6 +1,7 @@
 # core/undo_redo.py
 import logging
 from PySide6.QtCore import QObject, Signal
+from sortedcontainers import SortedSet
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +39,7 @@ class ModifyStateCommand(Command):
         self.segment_manager.segments = self._after_segments
         self.segment_manager.speaker_map = self._after_map
         # Re-derive unique labels from the restored map and segments
-        self.segment_manager.unique_speaker_labels = set(self.segment_manager.speaker_map.keys())
+        self.segment_manager.unique_speaker_labels = SortedSet(self.segment_manager.speaker_map.keys())
         for seg in self.segment_manager.segments:
             if seg['speaker_raw'] not in ['SPEAKER_NONE_INTERNAL']:
                  self.segment_manager.unique_speaker_labels.add(seg['speaker_raw'])
@@ -48,7 +49,7 @@ class ModifyStateCommand(Command):
         self.segment_manager.segments = self._before_segments
         self.segment_manager.speaker_map = self._before_map
         # Re-derive unique labels
-        self.segment_manager.unique_speaker_labels = set(self.segment_manager.speaker_map.keys())
+        self.segment_manager.unique_speaker_labels = SortedSet(self.segment_manager.speaker_map.keys())
         for seg in self.segment_manager.segments:
             if seg['speaker_raw'] not in ['SPEAKER_NONE_INTERNAL']:
                  self.segment_manager.unique_speaker_labels.add(seg['speaker_raw'])
@@ -1,18 +1,28 @@
 # main_pyside.py
 
+import hashlib
+import io
+import json
 import sys
 import multiprocessing
 import os
 import logging
 import ssl      
 import certifi
-from queue import Empty
 import platform # --- NEW IMPORT
-import requests # --- NEW IMPORT
+import requests
 import tempfile # --- NEW IMPORT
 import subprocess # --- NEW IMPORT
 import shutil # --- NEW IMPORT
 from packaging.version import Version # --- NEW IMPORT
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+DOWNLOAD_BUFFER_SIZE = 8 * 1024 * 1024
+# Large transcripts are inserted into the output area in pieces of this many lines / characters.
+OUTPUT_CHUNK_LINES = 1000
+OUTPUT_CHUNK_CHARS = 64 * 1024
 
 # Keep only the most essential, safe imports at the global level
 # QApplication must be imported here for the app instance to be created.
@@ -49,25 +59,44 @@ def _get_bundled_ffmpeg_path():
         return os.path.join(sys._MEIPASS, 'bin', exe_name)
     return None # Return None if not bundled
 
+_http_session = None
+
+def _get_http_session():
+    """Returns the requests.Session used by Downloader, so repeated update downloads reuse pooled connections. The release check goes through QNetworkAccessManager instead."""
+    global _http_session
+    if _http_session is None:
+        _http_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4)
+        _http_session.mount("http://", adapter)
+        _http_session.mount("https://", adapter)
+    return _http_session
+
+_font_families = None
+
+def _get_font_families():
+    """Returns the sorted system font families. The first call enumerates every installed font, so the result is kept for the process."""
+    global _font_families
+    if _font_families is None:
+        from PySide6.QtGui import QFontDatabase
+        _font_families = tuple(sorted(QFontDatabase.families()))
+    return _font_families
+
 
 def run_app():
     """
     Contains all application logic and imports.
     """
     # --- [THE FIX] Added 'Qt' to this import line ---
-    from PySide6.QtCore import QObject, Slot, QTimer, QThread, Signal, Qt
+    from PySide6.QtCore import QObject, Slot, QTimer, QThread, Signal, Qt, QUrl, QEventLoop, QRunnable, QThreadPool, QDir
+    from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
     # ----------------------------------------------------
 
-    from PySide6.QtWidgets import QFileDialog, QMessageBox, QLineEdit, QPushButton, QComboBox, QFrame, QCheckBox, QProgressBar, QLabel, QTextEdit, QWidget, QTabWidget, QGroupBox
-    from PySide6.QtGui import QIcon, QFontMetrics, QFont, QFontDatabase
-    from PySide6.QtUiTools import QUiLoader
+    from PySide6.QtWidgets import QMessageBox, QWidget, QMainWindow
+    from PySide6.QtGui import QIcon, QPixmap, QFont
 
     from utils.logging_setup import setup_logging
     from utils import constants
     from utils.config_manager import ConfigManager
-    from ui.correction_view_logic import CorrectionViewLogic
-    from core.app_worker import processing_worker_function
-    from core.audio_processor import AudioProcessor
     from ui.selectable_text_edit import SelectableTextEdit
     from utils import tips_data
 
@@ -75,19 +104,46 @@ def run_app():
     logger = logging.getLogger(__name__)
 
 
-    # --- UPDATE CHECKER THREAD ---
-    class UpdateChecker(QThread):
-        update_available = Signal(str, str, str) # version, release_notes, download_url
+    # --- UPDATE CHECKER ---
+    class UpdateChecker(QObject):
+        """
+        Asks GitHub for the latest release with a single asynchronous QNetworkAccessManager
+        request on the GUI event loop, so no thread or requests stack is needed for it.
+        """
+        update_available = Signal(str, str, str, str) # version, release_notes, download_url, sha256 (may be empty)
+        # Parsed once when the class is defined rather than on every check.
+        CURRENT_VERSION = Version(constants.APP_VERSION)
 
-        def __init__(self, owner, repo):
-            super().__init__()
+        def __init__(self, owner, repo, parent=None):
+            super().__init__(parent)
             self.owner = owner
             self.repo = repo
+            self.nam = None
+            self.reply = None
             self.current_os_string = self._get_os_string()
             if not self.current_os_string:
                 logger.warning("Auto-updates not supported on this OS.")
                 return
             self.asset_name = f"AutoVerse-{self.current_os_string}-App.zip"
+            self.cache = self._load_cache()
+
+        @staticmethod
+        def _load_cache():
+            try:
+                with open(constants.UPDATE_CACHE_FILE, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                return cache if isinstance(cache, dict) and 'body' in cache else {}
+            except (OSError, ValueError):
+                return {}
+
+        @staticmethod
+        def _save_cache(cache):
+            try:
+                os.makedirs(os.path.dirname(constants.UPDATE_CACHE_FILE), exist_ok=True)
+                with open(constants.UPDATE_CACHE_FILE, 'w', encoding='utf-8') as f:
+                    json.dump(cache, f)
+            except OSError as e:
+                logger.warning(f"Could not write update cache: {e}")
 
         def _get_os_string(self):
             system = platform.system()
@@ -95,53 +151,152 @@ def run_app():
             if system == "Darwin": return "macOS"
             return None
         
-        def run(self):
+        def start(self):
             if not self.current_os_string:
                 return
+            url = f"https://api.github.com/repos/{self.owner}/{self.repo}/releases/latest"
+            logger.info(f"Checking for updates at: {url}")
+            request = QNetworkRequest(QUrl(url))
+            request.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader, f"AutoVerse/{constants.APP_VERSION}")
+            request.setTransferTimeout(10000)
+            # Conditional request: an unchanged release answers 304 with no body and doesn't count against the rate limit.
+            if self.cache.get('etag'): request.setRawHeader(b"If-None-Match", self.cache['etag'].encode())
+            if self.cache.get('last_modified'): request.setRawHeader(b"If-Modified-Since", self.cache['last_modified'].encode())
+            self.nam = QNetworkAccessManager(self)
+            self.reply = self.nam.get(request)
+            self.reply.finished.connect(self._on_reply_finished)
+
+        @Slot()
+        def _on_reply_finished(self):
+            reply, self.reply = self.reply, None
             try:
-                url = f"https://api.github.com/repos/{self.owner}/{self.repo}/releases/latest"
-                logger.info(f"Checking for updates at: {url}")
-                response = requests.get(url, timeout=10)
-                response.raise_for_status()
-                
-                latest_release = response.json()
-                latest_version_str = latest_release.get("tag_name", "v0.0.0").lstrip('v')
-                
-                if Version(latest_version_str) > Version(constants.APP_VERSION):
-                    logger.info(f"Update found! Current: {constants.APP_VERSION}, Latest: {latest_version_str}")
-                    download_url = ""
-                    for asset in latest_release.get("assets", []):
-                        if asset.get("name") == self.asset_name:
-                            download_url = asset.get("browser_download_url")
-                            break
-                    
-                    if download_url:
-                        self.update_available.emit(
-                            latest_version_str, 
-                            latest_release.get("body", "No release notes available."),
-                            download_url
-                        )
-                    else:
-                        logger.warning(f"Update {latest_version_str} found, but asset '{self.asset_name}' was not present.")
-            except requests.RequestException as e:
-                logger.warning(f"Could not check for updates (network issue): {e}")
+                status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+                if status == 304:
+                    logger.info("Latest release unchanged since last check; using cached response.")
+                    latest_release = self.cache['body']
+                elif reply.error() != QNetworkReply.NetworkError.NoError:
+                    logger.warning(f"Could not check for updates (network issue): {reply.errorString()}")
+                    return
+                else:
+                    latest_release = json.loads(bytes(reply.readAll()).decode('utf-8'))
+                    self._save_cache({
+                        'etag': bytes(reply.rawHeader(b"ETag")).decode() or None,
+                        'last_modified': bytes(reply.rawHeader(b"Last-Modified")).decode() or None,
+                        'body': latest_release,
+                    })
+                self._check_release(latest_release)
             except Exception as e:
                 logger.error(f"An unexpected error occurred during update check: {e}", exc_info=True)
+            finally:
+                reply.deleteLater()
+
+        def _check_release(self, latest_release):
+            latest_version_str = latest_release.get("tag_name", "v0.0.0").lstrip('v')
+            
+            if Version(latest_version_str) > self.CURRENT_VERSION:
+                logger.info(f"Update found! Current: {constants.APP_VERSION}, Latest: {latest_version_str}")
+                download_url = ""
+                expected_sha256 = ""
+                for asset in latest_release.get("assets", []):
+                    if asset.get("name") == self.asset_name:
+                        download_url = asset.get("browser_download_url")
+                        # GitHub publishes asset digests as "sha256:<hex>".
+                        digest = asset.get("digest") or ""
+                        if digest.startswith("sha256:"):
+                            expected_sha256 = digest[len("sha256:"):].lower()
+                        break
+                
+                if download_url:
+                    self.update_available.emit(
+                        latest_version_str, 
+                        latest_release.get("body", "No release notes available."),
+                        download_url,
+                        expected_sha256
+                    )
+                else:
+                    logger.warning(f"Update {latest_version_str} found, but asset '{self.asset_name}' was not present.")
+
+
+    # --- WORKER RESULT READER THREAD ---
+    class WorkerResultReader(QThread):
+        """
+        Blocks on the worker's result pipe and re-emits each message as a Qt signal, so the
+        GUI thread is only woken when the worker actually sends something.
+        """
+        progress = Signal(int)
+        status = Signal(str)
+        file_started = Signal(object)
+        batch_completed = Signal(object)
+
+        def __init__(self, conn):
+            super().__init__()
+            self.conn = conn
+
+        def run(self):
+            try:
+                while True:
+                    # Block for the next message, then drain whatever else is already waiting and
+                    # coalesce it: only the newest progress value and status text are emitted.
+                    messages = [self.conn.recv()]
+                    while self.conn.poll():
+                        messages.append(self.conn.recv())
+                    last_progress = last_status = None
+                    for msg_type, data in messages:
+                        if msg_type == constants.MSG_TYPE_PROGRESS: last_progress = data
+                        elif msg_type == constants.MSG_TYPE_STATUS: last_status = data
+                        elif msg_type == constants.MSG_TYPE_BATCH_FILE_START:
+                            # Supersedes the previous file's pending progress and status.
+                            last_progress = last_status = None
+                            self.file_started.emit(data)
+                        elif msg_type == constants.MSG_TYPE_BATCH_COMPLETED:
+                            self.batch_completed.emit(data)
+                            return
+                    if last_status is not None: self.status.emit(last_status)
+                    if last_progress is not None: self.progress.emit(last_progress)
+            except (EOFError, OSError):
+                # The worker closed its end of the pipe: it has exited.
+                logger.info("Worker result pipe closed.")
+
+
+    # --- TRANSCRIPT SAVE TASK ---
+    class SaveTaskSignals(QObject):
+        done = Signal(str)   # saved path
+        error = Signal(str)  # error message
+
+    class SaveTask(QRunnable):
+        """Writes a transcript on a QThreadPool thread so large saves don't block the GUI."""
+        def __init__(self, path, data, is_plain_text):
+            super().__init__()
+            self.path = path
+            self.data = data
+            self.is_plain_text = is_plain_text
+            self.signals = SaveTaskSignals()
+
+        def run(self):
+            try:
+                from core.audio_processor import AudioProcessor
+                AudioProcessor.save_to_txt(self.path, self.data, self.is_plain_text)
+                self.signals.done.emit(self.path)
+            except Exception as e:
+                logger.error(f"Failed to save transcription to {self.path}: {e}", exc_info=True)
+                self.signals.error.emit(str(e))
 
 
     # --- DOWNLOADER THREAD ---
     class Downloader(QThread):
         download_progress = Signal(int)
-        download_finished = Signal(bool, str)
+        download_finished = Signal(bool, str, str) # success, file_path, sha256 of the downloaded file
 
-        def __init__(self, url):
+        def __init__(self, url, session, expected_sha256=""):
             super().__init__()
             self.url = url
+            self.session = session
+            self.expected_sha256 = expected_sha256
 
         def run(self):
             try:
                 logger.info(f"Starting download from: {self.url}")
-                response = requests.get(self.url, stream=True, timeout=15)
+                response = self.session.get(self.url, stream=True, timeout=15)
                 response.raise_for_status()
                 total_size = int(response.headers.get('content-length', 0))
                 
@@ -149,47 +304,57 @@ def run_app():
                     file_path = temp_file.name
                 
                 downloaded_size = 0
-                with open(file_path, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
+                last_progress = -1
+                # Hash while streaming so the archive never has to be read back for verification.
+                sha256 = hashlib.sha256()
+                with open(file_path, 'wb', buffering=DOWNLOAD_BUFFER_SIZE) as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                         f.write(chunk)
+                        sha256.update(chunk)
                         downloaded_size += len(chunk)
-                        progress = int((downloaded_size / total_size) * 100) if total_size > 0 else 0
-                        self.download_progress.emit(progress)
+                        # Without a content-length the percentage is unknown; leave the bar alone.
+                        if total_size <= 0: continue
+                        progress = downloaded_size * 100 // total_size
+                        # Only signal the UI when the whole-percent value actually moves.
+                        if progress != last_progress:
+                            last_progress = progress
+                            self.download_progress.emit(progress)
 
-                logger.info(f"Download complete. File saved to: {file_path}")
-                self.download_finished.emit(True, file_path)
+                digest = sha256.hexdigest()
+                if self.expected_sha256 and digest != self.expected_sha256:
+                    logger.error(f"Checksum mismatch for downloaded update: expected {self.expected_sha256}, got {digest}")
+                    os.remove(file_path)
+                    self.download_finished.emit(False, "", digest)
+                    return
+
+                logger.info(f"Download complete. File saved to: {file_path} (sha256 {digest})")
+                self.download_finished.emit(True, file_path, digest)
 
             except requests.RequestException as e:
                 logger.error(f"Download failed: {e}", exc_info=True)
-                self.download_finished.emit(False, "")
+                self.download_finished.emit(False, "", "")
             except Exception as e:
                 logger.error(f"An unexpected error occurred during download: {e}", exc_info=True)
-                self.download_finished.emit(False, "")
+                self.download_finished.emit(False, "", "")
 
     class MainApplication(QObject):
         def __init__(self, app_instance):
             super().__init__()
             self.app = app_instance
             
-            loader = QUiLoader()
-            loader.registerCustomWidget(SelectableTextEdit)
-
-            base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
-            ui_file_path = os.path.join(base_path, "ui", "main_window.ui")
-            
-            self.window = loader.load(ui_file_path, None)
+            self.ui = self._build_window()
             self.window.setWindowTitle(f"AutoVerse v{constants.APP_VERSION}")
             
-            if not self.window:
-                logger.critical(f"Failed to load UI file: {ui_file_path}")
-                sys.exit(1)
-            
             self.config_manager = ConfigManager(constants.DEFAULT_CONFIG_FILE)
             self.is_processing = False
+            self._token_loaded = False
+            # State last applied by set_ui_for_processing; the loaded UI starts in the idle state.
+            self._ui_processing = False
             
             self._promote_widgets()
 
-            self.correction_logic = CorrectionViewLogic(self.window)
+            # Built on first use of the Correction tab (see _ensure_correction_logic).
+            self.correction_logic = None
 
             self.tip_widgets = {
                 # --- Main Transcription Tab ---
@@ -210,18 +375,39 @@ def run_app():
                 self.window.show_tips_checkbox: "show_tips_checkbox_main",
             }
 
-            self._setup_fonts()
-            self._setup_icons()
+            self._setup_critical_icons()
             
             self.app.aboutToQuit.connect(self.cleanup)
 
-            self.audio_file_paths = []
+            self.audio_file_paths = ()
             self.process = None
-            self.queue = None
+            self.result_conn = None
+            self.result_reader = None
+            # Readers that outlived _stop_result_reader's wait, kept with their pipe until they return.
+            self._stale_readers = []
             self.last_single_file_result_path = None
+            # Worker processes come from a dedicated context rather than the global start method.
+            # On Linux a forkserver forks each worker from a small, Qt-free server process with the worker
+            # module (and its ML dependencies) already imported, instead of re-importing everything per run.
+            # Everywhere else it's spawn: Windows has no fork, and on macOS forking after torch and Apple's
+            # frameworks are initialised isn't safe. Each run there pays the full import cost again.
+            if not sys.platform.startswith('linux'):
+                self._mp_ctx = multiprocessing.get_context('spawn')
+            else:
+                self._mp_ctx = multiprocessing.get_context('forkserver')
+                self._mp_ctx.set_forkserver_preload(['core.app_worker'])
+
+            # Short model name of the most recent run, reused when its result is saved.
+            self._last_model_short = None
+            # Folder of the last successful save, offered first in the next save prompt.
+            self._last_save_dir = None
+            # Folder of the last media selection, where the next browse starts.
+            self._last_browse_dir = None
 
-            self.timer = QTimer()
-            self.timer.timeout.connect(self.check_queue)
+            # Crash detection only; worker messages arrive through the result reader thread.
+            self.watchdog = QTimer()
+            self.watchdog.setInterval(1000)
+            self.watchdog.timeout.connect(self._check_worker_alive)
             
             self.connect_signals()
             self.load_initial_settings()
@@ -230,7 +416,7 @@ def run_app():
             if getattr(sys, 'frozen', False):
                 logger.info("Application is frozen, initializing update check.")
                 # IMPORTANT: Replace with your GitHub username and repository name if needed
-                self.update_checker = UpdateChecker(owner="OLi-pel", repo="AutoVerse")
+                self.update_checker = UpdateChecker(owner="OLi-pel", repo="AutoVerse", parent=self)
                 self.update_checker.update_available.connect(self.prompt_for_update)
                 self.update_checker.start()
             else:
@@ -238,6 +424,8 @@ def run_app():
             # --------------------------------------------------------------------
 
             self.window.show()
+            # Let the window paint first; the remaining icons are read from disk on the next event-loop pass.
+            QTimer.singleShot(0, self._setup_icons_lazy)
 
         def _apply_tips_state(self, is_enabled):
             # --- [NEW] Hide or show the entire status bar ---
@@ -259,7 +447,7 @@ def run_app():
             self._apply_tips_state(is_enabled)
             
             # --- [NEW] Tell the correction logic to apply the state too ---
-            self.correction_logic.set_tips_enabled(is_enabled)
+            if self.correction_logic: self.correction_logic.set_tips_enabled(is_enabled)
             
             self.config_manager.set_main_window_show_tips(is_enabled)
             logger.info(f"Tips display set to: {is_enabled} and preference saved.")
@@ -270,13 +458,19 @@ def run_app():
                 logger.warning("Terminating active process due to application quit.")
                 self.process.terminate()
                 self.process.join(1)
-            if hasattr(self, 'correction_logic') and hasattr(self.correction_logic, 'audio_player'):
+            self._stop_result_reader()
+            # Nothing will deliver their EOF now; a QThread destroyed while running aborts the process.
+            for reader, _ in self._stale_readers:
+                reader.terminate()
+                reader.wait()
+            self._release_stale_readers()
+            if self.correction_logic and hasattr(self.correction_logic, 'audio_player'):
                 self.correction_logic.audio_player.destroy()
             logger.info("Cleanup finished.")
 
         # --- ALL UPDATE METHODS CORRECTLY DEFINED IN THE CLASS ---
-        @Slot(str, str, str)
-        def prompt_for_update(self, version, notes, url):
+        @Slot(str, str, str, str)
+        def prompt_for_update(self, version, notes, url, expected_sha256):
             msg_box = QMessageBox(self.window)
             msg_box.setWindowTitle(f"Update Available: v{version}")
             msg_box.setText(f"A new version of AutoVerse is available (<b>v{version}</b>). You have v{constants.APP_VERSION}.<br><br>Would you like to download and install it now?")
@@ -286,17 +480,17 @@ def run_app():
             msg_box.setDefaultButton(QMessageBox.Yes)
             
             if msg_box.exec() == QMessageBox.Yes:
-                self.start_download(url)
+                self.start_download(url, expected_sha256)
 
-        def start_download(self, url):
+        def start_download(self, url, expected_sha256=""):
             self.window.status_label.setText("Downloading update...")
-            self.downloader = Downloader(url)
+            self.downloader = Downloader(url, session=_get_http_session(), expected_sha256=expected_sha256)
             self.downloader.download_progress.connect(self.window.progress_bar.setValue)
             self.downloader.download_finished.connect(self.on_download_finished)
             self.downloader.start()
 
-        @Slot(bool, str)
-        def on_download_finished(self, success, file_path):
+        @Slot(bool, str, str)
+        def on_download_finished(self, success, file_path, sha256):
             if not success:
                 QMessageBox.critical(self.window, "Download Error", "Failed to download the update. Please try again later or visit the GitHub page to download it manually.")
                 self.window.status_label.setText("Update download failed.")
@@ -397,71 +591,153 @@ def run_app():
                 logger.error(f"Failed to create or launch updater script: {e}", exc_info=True)
                 QMessageBox.critical(self.window, "Update Error", f"Could not create the update script: {e}. Please update manually.")
         
+        def _build_window(self):
+            """
+            Builds the main window from the pyside6-uic class generated at build time
+            (ui/ui_main_window.py), which avoids parsing the .ui XML on every start. Source
+            checkouts without the generated module fall back to loading the .ui with QUiLoader.
+            Returns the generated Ui object, or None when the fallback was used.
+            """
+            try:
+                from ui.ui_main_window import Ui_MainWindow
+            except ImportError:
+                Ui_MainWindow = None
+
+            if Ui_MainWindow is not None:
+                self.window = QMainWindow()
+                ui = Ui_MainWindow()
+                ui.setupUi(self.window)
+                # Expose the widgets on the window the same way QUiLoader does.
+                for name, widget in vars(ui).items():
+                    setattr(self.window, name, widget)
+                return ui
+
+            from PySide6.QtUiTools import QUiLoader
+            loader = QUiLoader()
+            loader.registerCustomWidget(SelectableTextEdit)
+
+            base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+            ui_file_path = os.path.join(base_path, "ui", "main_window.ui")
+            
+            self.window = loader.load(ui_file_path, None)
+            if not self.window:
+                logger.critical(f"Failed to load UI file: {ui_file_path}")
+                sys.exit(1)
+            return None
+
         def _promote_widgets(self):
-            self.window.audio_file_entry = self.window.findChild(QLineEdit, "audio_file_entry")
-            self.window.browse_button = self.window.findChild(QPushButton, "browse_button")
-            self.window.model_dropdown = self.window.findChild(QComboBox, "model_dropdown")
-            self.window.diarization_checkbutton = self.window.findChild(QCheckBox, "diarization_checkbutton")
-            self.window.auto_merge_checkbutton = self.window.findChild(QCheckBox, "auto_merge_checkbutton")
-            self.window.timestamps_checkbutton_2 = self.window.findChild(QCheckBox, "timestamps_checkbutton_2")
-            self.window.end_times_checkbutton = self.window.findChild(QCheckBox, "end_times_checkbutton")
-            self.window.huggingface_token_frame = self.window.findChild(QGroupBox, "huggingface_token_frame")
-            self.window.huggingface_token_entry = self.window.findChild(QLineEdit, "huggingface_token_entry")
-            self.window.save_token_button = self.window.findChild(QPushButton, "save_token_button")
-            self.window.start_processing_button = self.window.findChild(QPushButton, "start_processing_button")
-            self.window.status_label = self.window.findChild(QLabel, "status_label")
-            self.window.progress_bar = self.window.findChild(QProgressBar, "progress_bar")
-            self.window.output_text_area = self.window.findChild(QTextEdit, "output_text_area")
-            self.window.correction_button = self.window.findChild(QPushButton, "correction_button")
-            self.window.main_tab_widget = self.window.findChild(QTabWidget, "tabWidget")
-            self.window.correction_transcription_entry = self.window.findChild(QLineEdit, "correction_transcription_entry")
-            self.window.correction_browse_transcription_btn = self.window.findChild(QPushButton, "correction_browse_transcription_btn")
-            self.window.correction_audio_entry = self.window.findChild(QLineEdit, "correction_audio_entry")
-            self.window.correction_browse_audio_btn = self.window.findChild(QPushButton, "correction_browse_audio_btn")
-            self.window.correction_load_files_btn = self.window.findChild(QPushButton, "correction_load_files_btn")
-            self.window.correction_assign_speakers_btn = self.window.findChild(QPushButton, "correction_assign_speakers_btn")
-            self.window.correction_save_changes_btn = self.window.findChild(QPushButton, "correction_save_changes_btn")
-            self.window.correction_play_pause_btn = self.window.findChild(QPushButton, "correction_play_pause_btn")
-            self.window.correction_rewind_btn = self.window.findChild(QPushButton, "correction_rewind_btn")
-            self.window.correction_forward_btn = self.window.findChild(QPushButton, "correction_forward_btn")
-            self.window.correction_timeline_frame = self.window.findChild(QWidget, "correction_timeline_frame")
-            self.window.correction_time_label = self.window.findChild(QLabel, "correction_time_label")
-            self.window.correction_text_area = self.window.findChild(SelectableTextEdit, "correction_text_area")
-            self.window.edit_speaker_btn = self.window.findChild(QPushButton, "edit_speaker_btn")
-            self.window.correction_text_edit_btn = self.window.findChild(QPushButton, "correction_text_edit_btn")
-            self.window.correction_timestamp_edit_btn = self.window.findChild(QPushButton, "correction_timestamp_edit_btn")
-            self.window.segment_btn = self.window.findChild(QPushButton, "segment_btn")
-            self.window.save_timestamp_btn = self.window.findChild(QPushButton, "save_timestamp_btn")
-            self.window.change_highlight_color_btn = self.window.findChild(QPushButton, "change_highlight_color_btn")
-            self.window.delete_segment_btn = self.window.findChild(QPushButton, "delete_segment_btn")
-            self.window.merge_segments_btn = self.window.findChild(QPushButton, "merge_segments_btn")
-            self.window.text_font_combo = self.window.findChild(QComboBox, "text_font")
-            self.window.font_size_combo = self.window.findChild(QComboBox, "Police_size")
-
-        def _setup_fonts(self):
-            font_id = QFontDatabase.font("Monaco", "Roman", 12)
-            if font_id == -1: self.window.monospace_font = QFont("Monospace", 12)
-            else: self.window.monospace_font = QFont("Monaco")
+            # The generated Ui class already holds every widget by name; otherwise use
+            # one traversal of the widget tree instead of a recursive findChild search per widget.
+            if self.ui is not None: widgets_by_name = vars(self.ui)
+            else: widgets_by_name = {w.objectName(): w for w in self.window.findChildren(QWidget)}
+            aliases = {"main_tab_widget": "tabWidget", "text_font_combo": "text_font", "font_size_combo": "Police_size",
+                       "undo_button": "Undo_button", "redo_button": "Redo_Button",
+                       "audio_file_frame": "Audio_file_frame", "processing_options_frame": "Processing_options_frame"}
+            for attr in ("audio_file_entry", "browse_button", "model_dropdown", "diarization_checkbutton", "auto_merge_checkbutton",
+                         "timestamps_checkbutton_2", "end_times_checkbutton", "huggingface_token_frame", "huggingface_token_entry",
+                         "save_token_button", "start_processing_button", "status_label", "progress_bar", "output_text_area",
+                         "correction_button", "main_tab_widget", "correction_transcription_entry", "correction_browse_transcription_btn",
+                         "correction_audio_entry", "correction_browse_audio_btn", "correction_load_files_btn", "correction_assign_speakers_btn",
+                         "correction_save_changes_btn", "correction_play_pause_btn", "correction_rewind_btn", "correction_forward_btn",
+                         "correction_timeline_frame", "correction_time_label", "correction_text_area", "edit_speaker_btn",
+                         "correction_text_edit_btn", "correction_timestamp_edit_btn", "segment_btn", "save_timestamp_btn",
+                         "change_highlight_color_btn", "delete_segment_btn", "merge_segments_btn", "text_font_combo", "font_size_combo",
+                         "undo_button", "redo_button", "show_tips_checkbox", "audio_file_frame", "processing_options_frame"):
+                setattr(self.window, attr, widgets_by_name.get(aliases.get(attr, attr)))
+
+        def _setup_fonts(self, font_families):
+            self.window.monospace_font = QFont("Monaco" if "Monaco" in font_families else "Monospace", 12)
             self.window.monospace_font.setStyleHint(QFont.StyleHint.Monospace)
 
-        def _setup_icons(self):
-            base_dir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
-            icon_dir = os.path.join(base_dir, 'assets', 'icons')
-            icon_map = { self.window.browse_button: "folder-open.png", self.window.save_token_button: "disk.png", self.window.correction_button: "next.png", self.window.correction_browse_transcription_btn: "folder-open.png", self.window.correction_browse_audio_btn: "folder-open.png", self.window.correction_save_changes_btn: "disk.png", self.window.correction_load_files_btn: "sort-down.png", self.window.correction_rewind_btn: "rewind.png", self.window.correction_forward_btn: "forward.png", self.window.correction_assign_speakers_btn: "user-add.png", self.window.findChild(QPushButton, "Undo_button"): "undo.png", self.window.findChild(QPushButton, "Redo_Button"): "redo.png", self.window.findChild(QCheckBox, "show_tips_checkbox"): "interrogation.png", self.window.change_highlight_color_btn: "palette.png", self.window.edit_speaker_btn: "user-pen.png", self.window.correction_text_edit_btn: "pencil.png", self.window.correction_timestamp_edit_btn: "stopwatch.png", self.window.segment_btn: "multiple.png", self.window.save_timestamp_btn: "disk.png", self.window.merge_segments_btn: "merge.png", self.window.delete_segment_btn: "trash.png"}
-            for widget, filename in icon_map.items():
-                if widget:
-                    icon_path = os.path.join(icon_dir, filename)
-                    if os.path.exists(icon_path): widget.setIcon(QIcon(icon_path))
-                    else: logger.warning(f"Icon not found: {icon_path}")
+        # Decoded icons, shared by every widget that uses the same file.
+        _icon_cache = {}
+
+        def _icon(self, filename):
+            """Returns the shared QIcon for a file in the icon directory (an empty icon if it is missing)."""
+            icon = self._icon_cache.get(filename)
+            if icon is None:
+                path = self._icon_paths.get(filename)
+                if path: icon = QIcon(path)
+                else:
+                    logger.warning(f"Icon not found: {os.path.join(self.icon_dir, filename)}")
+                    icon = QIcon()
+                self._icon_cache[filename] = icon
+            return icon
+
+        @staticmethod
+        def _read_bytes(path):
+            with open(path, 'rb') as f:
+                return f.read()
+
+        def _preload_icons(self, filenames):
+            """
+            Reads the icon files concurrently and decodes them into the cache. Only the
+            pixmap/QIcon construction has to happen on the GUI thread; the file reads don't.
+            Returns the names of the files that exist in the icon directory.
+            """
+            available = self._icon_paths
+            to_load = [f for f in dict.fromkeys(filenames) if f in available and f not in self._icon_cache]
+            if self._icons_in_resources:
+                # Compiled resources are already in memory; there is no file I/O to overlap.
+                for filename in to_load: self._icon_cache[filename] = QIcon(available[filename])
+                return available
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                contents = pool.map(self._read_bytes, (available[f] for f in to_load))
+                for filename, data in zip(to_load, contents):
+                    pixmap = QPixmap()
+                    pixmap.loadFromData(data)
+                    self._icon_cache[filename] = QIcon(pixmap)
+            return available
+
+        def _setup_critical_icons(self):
+            """Icons the window needs on first paint: the Start/Abort button states."""
+            try:
+                # Generated at build time by pyside6-rcc from assets/icons.qrc; the icons are
+                # then served from memory instead of being read out of the bundle's data files.
+                import resources_rc  # noqa: F401
+                self.icon_dir = ":/icons"
+                self._icons_in_resources = True
+                self._icon_paths = {name: f"{self.icon_dir}/{name}" for name in QDir(self.icon_dir).entryList(QDir.Files)}
+            except ImportError:
+                base_dir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+                self.icon_dir = os.path.join(base_dir, 'assets', 'icons')
+                self._icons_in_resources = False
+                # One directory listing up front; lookups afterwards never touch the filesystem.
+                try:
+                    with os.scandir(self.icon_dir) as it:
+                        self._icon_paths = {e.name: e.path for e in it if e.is_file()}
+                except OSError:
+                    logger.warning(f"Icon directory not found: {self.icon_dir}")
+                    self._icon_paths = {}
+            self.window.icon_play = self._icon("play.png")
+            self.window.icon_abort = self._icon("stop.png")
+            self.window.start_processing_button.setIcon(self.window.icon_play)
+
+        def _setup_icons_lazy(self):
+            """Everything else, loaded once the window is on screen."""
+            w = self.window
+            icon_map = [
+                (w.browse_button, "folder-open.png"), (w.save_token_button, "disk.png"), (w.correction_button, "next.png"),
+                (w.correction_browse_transcription_btn, "folder-open.png"), (w.correction_browse_audio_btn, "folder-open.png"),
+                (w.correction_save_changes_btn, "disk.png"), (w.correction_load_files_btn, "sort-down.png"),
+                (w.correction_rewind_btn, "rewind.png"), (w.correction_forward_btn, "forward.png"),
+                (w.correction_assign_speakers_btn, "user-add.png"), (w.undo_button, "undo.png"), (w.redo_button, "redo.png"),
+                (w.show_tips_checkbox, "interrogation.png"), (w.change_highlight_color_btn, "palette.png"),
+                (w.edit_speaker_btn, "user-pen.png"), (w.correction_text_edit_btn, "pencil.png"),
+                (w.correction_timestamp_edit_btn, "stopwatch.png"), (w.segment_btn, "multiple.png"),
+                (w.save_timestamp_btn, "disk.png"), (w.merge_segments_btn, "merge.png"), (w.delete_segment_btn, "trash.png"),
+            ]
+            available = self._preload_icons([filename for _, filename in icon_map] + ["pause.png", "pencil.png", "sign-out-alt.png", "stopwatch.png"])
+            for widget, filename in icon_map:
+                if widget is None: continue
+                if filename in available: widget.setIcon(self._icon(filename))
+                else: logger.warning(f"Icon not found: {os.path.join(self.icon_dir, filename)}")
             
-            self.window.icon_play = QIcon(os.path.join(icon_dir, "play.png"))
-            self.window.icon_abort = QIcon(os.path.join(icon_dir, "stop.png")) 
-            self.window.icon_pause = QIcon(os.path.join(icon_dir, "pause.png"))
-            self.window.icon_edit_text = QIcon(os.path.join(icon_dir, "pencil.png"))
-            self.window.icon_save_edit = QIcon(os.path.join(icon_dir, "sign-out-alt.png"))
-            self.window.icon_edit_timestamp = QIcon(os.path.join(icon_dir, "stopwatch.png"))
+            self.window.icon_pause = self._icon("pause.png")
+            self.window.icon_edit_text = self._icon("pencil.png")
+            self.window.icon_save_edit = self._icon("sign-out-alt.png")
+            self.window.icon_edit_timestamp = self._icon("stopwatch.png")
             self.window.icon_cancel_edit = self.window.icon_save_edit
-            self.window.start_processing_button.setIcon(self.window.icon_play)
             self.window.correction_play_pause_btn.setIcon(self.window.icon_play)
 
         def connect_signals(self):
@@ -471,25 +747,38 @@ def run_app():
             self.window.diarization_checkbutton.stateChanged.connect(self.toggle_advanced_options)
             self.window.correction_button.clicked.connect(self.go_to_correction)
             self.window.show_tips_checkbox.stateChanged.connect(self.on_tips_toggled)
+            self.window.main_tab_widget.currentChanged.connect(self._on_tab_changed)
 
         def toggle_advanced_options(self, state):
             is_checked = (state == 2)
+            # The token is only needed with diarization, so it is read the first time the field is shown.
+            if is_checked and not self._token_loaded:
+                token = self.config_manager.load_huggingface_token()
+                if token: self.window.huggingface_token_entry.setText(token)
+                self._token_loaded = True
             if self.window.huggingface_token_frame: self.window.huggingface_token_frame.setVisible(is_checked)
             if self.window.auto_merge_checkbutton: self.window.auto_merge_checkbutton.setEnabled(is_checked)
             if not is_checked: self.window.auto_merge_checkbutton.setChecked(False)
 
         def set_ui_for_processing(self, is_processing):
-            self.window.findChild(QGroupBox, "Audio_file_frame").setEnabled(not is_processing)
-            self.window.findChild(QGroupBox, "Processing_options_frame").setEnabled(not is_processing)
-            self.window.start_processing_button.setEnabled(True) 
-            self.window.main_tab_widget.setTabEnabled(1, not is_processing)
-            
-            if is_processing:
-                self.window.start_processing_button.setText("Abort")
-                self.window.start_processing_button.setIcon(self.window.icon_abort)
-            else:
-                self.window.start_processing_button.setText("Start Processing")
-                self.window.start_processing_button.setIcon(self.window.icon_play)
+            if is_processing == self._ui_processing: return
+            self._ui_processing = is_processing
+            # Repaint once after all the state changes rather than once per widget.
+            self.window.setUpdatesEnabled(False)
+            try:
+                self.window.audio_file_frame.setEnabled(not is_processing)
+                self.window.processing_options_frame.setEnabled(not is_processing)
+                self.window.start_processing_button.setEnabled(True) 
+                self.window.main_tab_widget.setTabEnabled(1, not is_processing)
+                
+                if is_processing:
+                    self.window.start_processing_button.setText("Abort")
+                    self.window.start_processing_button.setIcon(self.window.icon_abort)
+                else:
+                    self.window.start_processing_button.setText("Start Processing")
+                    self.window.start_processing_button.setIcon(self.window.icon_play)
+            finally:
+                self.window.setUpdatesEnabled(True)
             
             self.is_processing = is_processing
         
@@ -498,27 +787,17 @@ def run_app():
 
         def load_initial_settings(self):
             self.window.correction_button.setEnabled(False)
-            self.window.model_dropdown.addItems(["tiny", "base", "small", "medium", "large (recommended)", "turbo"])
-            self.window.model_dropdown.setCurrentText("large (recommended)")
             if self.window.huggingface_token_frame: self.window.huggingface_token_frame.hide()
-            token = self.config_manager.load_huggingface_token()
-            if token: self.window.huggingface_token_entry.setText(token)
             
-            font_sizes = ["8", "9", "10", "11", "12", "14", "16", "18", "24", "36"]
-            self.window.font_size_combo.addItems(font_sizes)
-            self.window.font_size_combo.setCurrentText("12")
-
-            db = QFontDatabase()
-            font_families = db.families()
-            self.window.text_font_combo.addItems(font_families)
-            
-            default_font = "Monaco" if "Monaco" in font_families else "Courier New" if "Courier New" in font_families else "Monospace"
-            self.window.text_font_combo.setCurrentText(default_font)
+            self._fill_combo(self.window.model_dropdown, constants.MODEL_CHOICES, constants.DEFAULT_MODEL_CHOICE)
+            self._fill_combo(self.window.font_size_combo, constants.FONT_SIZE_CHOICES, "12")
+            # Enumerating the system fonts is slow, so it runs once the window is on screen.
+            QTimer.singleShot(0, self._load_fonts)
 
             if self.window.correction_play_pause_btn:
                 button = self.window.correction_play_pause_btn
-                font_metrics = QFontMetrics(button.font())
-                text_width = font_metrics.boundingRect("Pause ").width()
+                # The widget's own metrics object; horizontalAdvance only sums advances, no glyph bounds pass.
+                text_width = button.fontMetrics().horizontalAdvance("Pause ")
                 padding = 40 
                 button.setFixedWidth(text_width + padding)
                 
@@ -526,12 +805,32 @@ def run_app():
             show_tips = self.config_manager.get_main_window_show_tips()
             self.window.show_tips_checkbox.setChecked(show_tips)
             
-            # Apply the preference to both the main window and the correction logic
             self._apply_tips_state(show_tips)
-            self.correction_logic.set_tips_enabled(show_tips)
             
             logger.info(f"Loaded tips preference on startup: {show_tips}")
 
+        def _load_fonts(self):
+            """Fills the font combo from the system font list and applies the resulting fonts."""
+            families = _get_font_families()
+            family_set = frozenset(families)
+            self._setup_fonts(family_set)
+            default_font = "Monaco" if "Monaco" in family_set else "Courier New" if "Courier New" in family_set else "Monospace"
+            self._fill_combo(self.window.text_font_combo, families, default_font)
+            # Signals were blocked while filling the font combo, so apply the resulting font once here.
+            if self.correction_logic: self.correction_logic._update_text_area_font()
+
+        @staticmethod
+        def _fill_combo(combo, items, current_text):
+            """Bulk-fills a combo box without a repaint or currentTextChanged emission per inserted item."""
+            combo.blockSignals(True)
+            combo.setUpdatesEnabled(False)
+            try:
+                combo.addItems(items)
+                combo.setCurrentText(current_text)
+            finally:
+                combo.setUpdatesEnabled(True)
+                combo.blockSignals(False)
+
         def save_huggingface_token(self):
             token = self.window.huggingface_token_entry.text().strip()
             self.config_manager.save_huggingface_token(token)
@@ -542,10 +841,12 @@ def run_app():
         def select_files(self):
             from PySide6.QtWidgets import QFileDialog
             if self.is_processing: return
-            file_filter = ("All Media Files (*.wav *.mp3 *.aac *.flac *.m4a *.mp4 *.mov *.avi *.mkv);;Audio Files (*.wav *.mp3 *.aac *.flac *.m4a);;Video Files (*.mp4 *.mov *.avi *.mkv);;All Files (*)")
-            paths, _ = QFileDialog.getOpenFileNames(self.window, "Select Audio or Video Files", "", file_filter)
+            # Read-only and without symlink resolution, the dialog does less per-entry work on network shares.
+            paths, _ = QFileDialog.getOpenFileNames(self.window, "Select Audio or Video Files", self._last_browse_dir or "", constants.MEDIA_FILE_FILTER,
+                                                    options=QFileDialog.Option.DontResolveSymlinks | QFileDialog.Option.ReadOnly)
             if paths:
-                self.audio_file_paths = paths
+                self._last_browse_dir = os.path.dirname(paths[0])
+                self.audio_file_paths = tuple(paths)
                 self.window.audio_file_entry.setText(paths[0] if len(paths) == 1 else f"{len(paths)} files selected")
                 self.window.correction_button.setEnabled(False)
 
@@ -555,8 +856,9 @@ def run_app():
                 if self.process.is_alive():
                     self.process.terminate()
                     self.process.join(timeout=1)
-                self.timer.stop()
+                self.watchdog.stop()
                 self.process = None
+                self._stop_result_reader()
                 self.window.status_label.setText("Processing aborted by user.")
                 self.window.progress_bar.setValue(0)
                 self.set_ui_for_processing(False)
@@ -568,6 +870,7 @@ def run_app():
 
             destination_folder = None
             if len(self.audio_file_paths) > 1:
+                from PySide6.QtWidgets import QFileDialog
                 destination_folder = QFileDialog.getExistingDirectory(self.window, "Select Destination Folder for Transcriptions")
                 if not destination_folder:
                     self.window.status_label.setText("Batch processing cancelled.")
@@ -578,52 +881,91 @@ def run_app():
             self.window.output_text_area.clear()
             
             options = self.get_processing_options()
+            self._last_model_short = options["model_key"].split(" ", 1)[0]
             cache_dir = os.path.join(os.path.expanduser('~'), 'AutoVerse_Cache')
             
             ffmpeg_path = _get_bundled_ffmpeg_path()
             if ffmpeg_path:
                 logger.info(f"Main process identified bundled ffmpeg: {ffmpeg_path}")
 
-            self.queue = multiprocessing.Queue()
-            self.process = multiprocessing.Process(
+            # Imported here rather than at startup: the worker module pulls in torch, whisper and pyannote.
+            from core.app_worker import processing_worker_function
+
+            # Single producer, single consumer: a one-way pipe avoids Queue's feeder thread and locking.
+            self.result_conn, child_conn = self._mp_ctx.Pipe(duplex=False)
+            self.process = self._mp_ctx.Process(
                 target=processing_worker_function, 
-                args=(self.queue, self.audio_file_paths, options, cache_dir, destination_folder, ffmpeg_path), 
+                args=(child_conn, self.audio_file_paths, options, cache_dir, destination_folder, ffmpeg_path), 
                 daemon=True
             )
             self.process.start()
-            self.timer.start(100)
+            # Drop the parent's copy of the write end so a dead worker shows up as EOF.
+            child_conn.close()
+            self.result_reader = WorkerResultReader(self.result_conn)
+            self.result_reader.progress.connect(self.window.progress_bar.setValue)
+            self.result_reader.status.connect(self.window.status_label.setText)
+            self.result_reader.file_started.connect(self._on_file_started)
+            self.result_reader.batch_completed.connect(self._on_batch_completed)
+            self.result_reader.finished.connect(self._check_worker_alive)
+            self.result_reader.start()
+            self.watchdog.start()
 
-        def check_queue(self):
-            try:
-                msg_type, data = self.queue.get_nowait()
-                if msg_type == constants.MSG_TYPE_PROGRESS:
-                    self.window.progress_bar.setValue(data)
-                elif msg_type == constants.MSG_TYPE_STATUS:
-                    self.window.status_label.setText(data)
-                elif msg_type == constants.MSG_TYPE_BATCH_FILE_START:
-                    file_info = data
-                    status = f"Processing file {file_info[constants.KEY_BATCH_CURRENT_IDX]} of {file_info[constants.KEY_BATCH_TOTAL_FILES]}: {file_info[constants.KEY_BATCH_FILENAME]}"
-                    self.window.status_label.setText(status)
-                    self.window.progress_bar.setValue(0)
-                elif msg_type == constants.MSG_TYPE_BATCH_COMPLETED:
-                    self.timer.stop()
-                    if self.process:
-                        self.process.join()
-                        self.process = None
-                    self.handle_batch_results(data)
-            
-            except Empty:
-                if self.is_processing and (not self.process or not self.process.is_alive()):
-                    self.timer.stop()
-                    self.process = None
-                    self.set_ui_for_processing(False)
-                    if "aborted" not in self.window.status_label.text():
-                        QMessageBox.critical(self.window, "Error", "Processing stopped unexpectedly.")
-                        self.window.status_label.setText("Error: Processing stopped unexpectedly.")
+        def _stop_result_reader(self):
+            # The reader returns on its own once the worker is gone (EOF); only then is the pipe closed.
+            if self.result_reader:
+                if not self.result_reader.wait(2000):
+                    # Still blocked in recv(): keep the thread and its pipe referenced until it returns.
+                    logger.warning("Result reader did not stop in time; releasing it once it finishes.")
+                    self._stale_readers.append((self.result_reader, self.result_conn))
+                    self.result_reader.finished.connect(self._release_stale_readers)
+                    self.result_reader = None
+                    self.result_conn = None
+                    # In case it finished between the timeout and the connect.
+                    self._release_stale_readers()
+                    return
+                self.result_reader = None
+            if self.result_conn:
+                self.result_conn.close()
+                self.result_conn = None
+
+        @Slot()
+        def _release_stale_readers(self):
+            for reader, conn in [entry for entry in self._stale_readers if not entry[0].isRunning()]:
+                conn.close()
+                self._stale_readers.remove((reader, conn))
+
+        @Slot(object)
+        def _on_file_started(self, file_info):
+            status = f"Processing file {file_info[constants.KEY_BATCH_CURRENT_IDX]} of {file_info[constants.KEY_BATCH_TOTAL_FILES]}: {file_info[constants.KEY_BATCH_FILENAME]}"
+            self.window.status_label.setText(status)
+            self.window.progress_bar.setValue(0)
+
+        @Slot(object)
+        def _on_batch_completed(self, data):
+            self.watchdog.stop()
+            if self.process:
+                self.process.join()
+                self.process = None
+            self._stop_result_reader()
+            self.handle_batch_results(data)
+
+        @Slot()
+        def _check_worker_alive(self):
+            # Anything the worker sent before dying is delivered by the reader before it finishes,
+            # so only treat it as a crash once both the process and the reader are gone.
+            # No reader means the run has already been completed or aborted.
+            if not self.is_processing or self.result_reader is None: return
+            if (self.process and self.process.is_alive()) or self.result_reader.isRunning(): return
+            self.watchdog.stop()
+            self.process = None
+            self._stop_result_reader()
+            self.set_ui_for_processing(False)
+            if "aborted" not in self.window.status_label.text():
+                QMessageBox.critical(self.window, "Error", "Processing stopped unexpectedly.")
+                self.window.status_label.setText("Error: Processing stopped unexpectedly.")
 
         def handle_batch_results(self, final_payload):
             results = final_payload[constants.KEY_BATCH_ALL_RESULTS]
-            summary = []
             successful_count = 0
             error_count = 0
             
@@ -631,30 +973,52 @@ def run_app():
                 result = results[0]
                 self.window.progress_bar.setValue(100)
                 if result.status == constants.STATUS_SUCCESS:
-                    output_text = "\n".join(result.data) if isinstance(result.data, list) else str(result.data)
-                    self.window.output_text_area.setPlainText(output_text)
+                    self._show_output(result.data if isinstance(result.data, list) else str(result.data))
                     self.prompt_and_save_single_result(result)
                 else:
                     msg = result.message or "An unknown error occurred."
                     self.window.status_label.setText(f"Error: {msg[:100]}...")
                     self.window.output_text_area.setPlainText(f"An error occurred:\n{msg}")
-                    QMessageBox.critical(self.window, "Processing Error", msg)
+                    # Posted so the finished state is painted before the modal box takes over.
+                    QTimer.singleShot(0, lambda m=msg: QMessageBox.critical(self.window, "Processing Error", m))
             else: 
+                # Build the summary in one growable buffer rather than a list of lines joined at the end.
+                summary = io.StringIO()
                 for result in results:
                     file_name = os.path.basename(result.source_file)
+                    if successful_count or error_count: summary.write("\n")
                     if result.status == constants.STATUS_SUCCESS:
                         successful_count += 1
-                        summary.append(f"SUCCESS: '{file_name}' saved to '{os.path.basename(result.output_path)}'")
+                        summary.write(f"SUCCESS: '{file_name}' saved to '{os.path.basename(result.output_path)}'")
                     else:
                         error_count += 1
-                        summary.append(f"ERROR: '{file_name}' - {result.message}")
-                self.window.output_text_area.setPlainText("\n".join(summary))
+                        summary.write(f"ERROR: '{file_name}' - {result.message}")
+                self._show_output(summary.getvalue())
                 final_status_msg = f"Batch finished. {successful_count} successful, {error_count} failed."
                 self.window.status_label.setText(final_status_msg)
-                QMessageBox.information(self.window, "Batch Processing Complete", final_status_msg)
+                QTimer.singleShot(0, lambda m=final_status_msg: QMessageBox.information(self.window, "Batch Processing Complete", m))
             
             self.set_ui_for_processing(False)
         
+        def _show_output(self, content):
+            """
+            Fills the output area from a list of lines or a string, inserting it piecewise so a
+            multi-megabyte transcript doesn't freeze the window in a single setPlainText layout.
+            """
+            area = self.window.output_text_area
+            area.setUndoRedoEnabled(False)
+            area.clear()
+            cursor = area.textCursor()
+            if isinstance(content, str):
+                pieces = (content[i:i + OUTPUT_CHUNK_CHARS] for i in range(0, len(content), OUTPUT_CHUNK_CHARS))
+            else:
+                pieces = (("\n" if i else "") + "\n".join(content[i:i + OUTPUT_CHUNK_LINES]) for i in range(0, len(content), OUTPUT_CHUNK_LINES))
+            for piece in pieces:
+                cursor.insertText(piece)
+                # Keep painting between pieces, but don't let clicks re-enter while the result is being handled.
+                QApplication.processEvents(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
+            area.setUndoRedoEnabled(True)
+
         def prompt_and_save_single_result(self, result):
             if hasattr(result, 'output_path') and result.output_path:
                 self.last_single_file_result_path = result.output_path
@@ -663,23 +1027,57 @@ def run_app():
                 return
 
             base_name, _ = os.path.splitext(os.path.basename(result.source_file))
-            model_name = self.get_processing_options()["model_key"].split(" ")[0]
-            default_fn = os.path.join(os.getcwd(), f"{base_name}_{model_name}_transcription.txt")
-            save_path, _ = QFileDialog.getSaveFileName(self.window, "Save Transcription As", default_fn, "Text Files (*.txt)")
-            
-            if save_path:
-                try:
-                    AudioProcessor.save_to_txt(save_path, result.data, result.is_plain_text_output)
-                    self.window.status_label.setText(f"Transcription saved to {os.path.basename(save_path)}")
-                    QMessageBox.information(self.window, "Success", f"Transcription saved to {save_path}")
-                    self.last_single_file_result_path = save_path
-                    self.window.correction_button.setEnabled(True)
-                except Exception as e:
-                    QMessageBox.critical(self.window, "Save Error", f"Could not save file: {e}")
-                    self.window.correction_button.setEnabled(False)
-            else:
-                self.window.status_label.setText("Save cancelled by user.")
-                self.window.correction_button.setEnabled(False)
+            model_name = self._last_model_short
+            start_dir = self._last_save_dir or os.path.dirname(result.source_file) or os.getcwd()
+            default_fn = os.path.join(start_dir, f"{base_name}_{model_name}_transcription.txt")
+            from PySide6.QtWidgets import QFileDialog
+            # Window-modal but asynchronous: the event loop keeps running while the user picks a path.
+            dialog = QFileDialog(self.window, "Save Transcription As", default_fn, "Text Files (*.txt)")
+            dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptSave)
+            dialog.setAttribute(Qt.WA_DeleteOnClose)
+            dialog.fileSelected.connect(lambda save_path: self._save_single_result(save_path, result))
+            dialog.rejected.connect(self._on_save_cancelled)
+            dialog.open()
+
+        def _save_single_result(self, save_path, result):
+            self.window.status_label.setText(f"Saving transcription to {os.path.basename(save_path)}...")
+            task = SaveTask(save_path, result.data, result.is_plain_text_output)
+            task.signals.done.connect(self._on_single_result_saved)
+            task.signals.error.connect(self._on_single_result_save_failed)
+            QThreadPool.globalInstance().start(task)
+
+        @Slot(str)
+        def _on_single_result_saved(self, save_path):
+            self.window.status_label.setText(f"Transcription saved to {os.path.basename(save_path)}")
+            QMessageBox.information(self.window, "Success", f"Transcription saved to {save_path}")
+            self.last_single_file_result_path = save_path
+            self._last_save_dir = os.path.dirname(save_path)
+            self.window.correction_button.setEnabled(True)
+
+        @Slot(str)
+        def _on_single_result_save_failed(self, error_message):
+            QMessageBox.critical(self.window, "Save Error", f"Could not save file: {error_message}")
+            self.window.correction_button.setEnabled(False)
+
+        @Slot()
+        def _on_save_cancelled(self):
+            self.window.status_label.setText("Save cancelled by user.")
+            self.window.correction_button.setEnabled(False)
+
+        def _ensure_correction_logic(self):
+            """
+            Creates the correction view controller on first use. Its import pulls in the audio
+            player stack (pyaudio, soundfile, scipy, moviepy), which stays off the startup path.
+            """
+            if self.correction_logic is None:
+                from ui.correction_view_logic import CorrectionViewLogic
+                self.correction_logic = CorrectionViewLogic(self.window)
+                self.correction_logic.set_tips_enabled(self.window.show_tips_checkbox.isChecked())
+            return self.correction_logic
+
+        @Slot(int)
+        def _on_tab_changed(self, index):
+            if index == 1: self._ensure_correction_logic()
 
         @Slot()
         def go_to_correction(self):
@@ -689,7 +1087,7 @@ def run_app():
                 
             audio_path = self.audio_file_paths[0]
             txt_path = self.last_single_file_result_path
-            self.correction_logic.load_files_from_paths(audio_path=audio_path, txt_path=txt_path)
+            self._ensure_correction_logic().load_files_from_paths(audio_path=audio_path, txt_path=txt_path)
             self.window.main_tab_widget.setCurrentIndex(1)
 
     # --- Start of main execution ---
@@ -700,5 +1098,4 @@ def run_app():
 if __name__ == "__main__":
     configure_ssl_for_bundle()
     multiprocessing.freeze_support()
-    multiprocessing.set_start_method('spawn', force=True)
     run_app()
\ No newline at end of file
@@ -0,0 +1,18 @@
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("whisper")
+
+from core.transcription_handler import SAMPLE_RATE, TranscriptionHandler
+
+
+def test_restore_original_timeline_keeps_seam_aligned_end_in_its_chunk():
+    # Speech at 1-2s and 5-6s of the original audio: stitched 0-1s and 1-2s, seam at 1s.
+    chunks = [{'start': 1 * SAMPLE_RATE, 'end': 2 * SAMPLE_RATE},
+              {'start': 5 * SAMPLE_RATE, 'end': 6 * SAMPLE_RATE}]
+    segments = [{'start': 0.0, 'end': 1.0}, {'start': 1.0, 'end': 1.5}]
+
+    TranscriptionHandler._restore_original_timeline(segments, chunks)
+
+    assert segments[0] == {'start': 1.0, 'end': 2.0}
+    assert segments[1] == {'start': 5.0, 'end': 5.5}
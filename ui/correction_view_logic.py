@@ -1,15 +1,18 @@
 # ui/correction_view_logic.py
 import logging, sys, os
 from copy import deepcopy
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from PySide6.QtWidgets import (QFileDialog, QMessageBox, QVBoxLayout, QColorDialog, QDialog, 
                                QDialogButtonBox, QLabel, QLineEdit, QGridLayout, QScrollArea, 
                                QWidget, QComboBox, QRadioButton, QHBoxLayout, QPushButton,
                                QSizePolicy)
-from PySide6.QtCore import QObject, Slot, Qt, QSize
+from PySide6.QtCore import QObject, Slot, Signal, Qt, QSize, QRunnable, QThreadPool, QTimer
 from PySide6.QtGui import QTextCursor, QTextCharFormat, QColor, QFont, QIcon
 
 from core.correction_window_logic import SegmentManager
-from core.audio_player import AudioPlayer
+from core.audio_player import AudioPlayer, decode_media_file
 from core.undo_redo import UndoManager, ModifyStateCommand
 from utils import constants
 from ui.timeline_frame import WaveformFrame
@@ -18,6 +21,57 @@ from utils import tips_data
 
 logger = logging.getLogger(__name__)
 
+# Clearing a multi-selection at least this large resets the whole document's format in one pass instead of per segment.
+BULK_FORMAT_RESET_MIN = 32
+
+# Smallest playback-position change (seconds) that refreshes the time label, timeline and highlight; caps it at ~25 Hz.
+PROGRESS_MIN_STEP = 0.04
+
+class _FileTaskSignals(QObject):
+    done = Signal(object)  # return value of the task function
+    error = Signal(str)    # error message
+
+class _FileTask(QRunnable):
+    """Runs blocking file I/O (and media decoding) on a QThreadPool thread so the correction view stays responsive."""
+    def __init__(self, func, *args):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.signals = _FileTaskSignals()
+
+    def run(self):
+        try:
+            result = self.func(*self.args)
+        except Exception as e:
+            logger.error(f"Background file task failed: {e}", exc_info=True)
+            self.signals.error.emit(str(e))
+            return
+        self.signals.done.emit(result)
+
+@lru_cache(maxsize=2048)
+def _format_ms(ms):
+    m, ms = divmod(ms, 60000)
+    return f"{m:02d}:{ms / 1000:06.3f}"
+
+def _doc_len(text):
+    """Length of text in QTextDocument positions, which count UTF-16 code units rather than code points."""
+    return len(text) if text.isascii() else len(text.encode('utf-16-le')) // 2
+
+def _read_lines(path):
+    with open(path, 'r', encoding='utf-8') as f: return f.readlines()
+
+def _read_transcription_and_media(txt_path, audio_path):
+    # The two files are independent: read the transcript on a second thread while the media decodes here.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        lines_future = executor.submit(_read_lines, txt_path)
+        decoded = decode_media_file(audio_path)
+        return lines_future.result(), decoded
+
+def _write_lines(path, lines):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
+    return path
+
 class CorrectionViewLogic(QObject):
     def __init__(self, main_window):
         super().__init__()
@@ -26,6 +80,23 @@ class CorrectionViewLogic(QObject):
         self.audio_player = AudioPlayer()
         self.undo_manager = UndoManager()
         self.original_text_before_edit = None
+        self._loading = False
+        self._last_progress_time = -1.0
+        self._duration_label = (None, "")  # (duration, formatted duration) shown in the time label
+        self._btn_refresh_pending = False
+        # Speaker-name dialog, built on first use and reused.
+        self._spk_dialog = None
+        # Folder of the last file picked or saved here, where the next file dialog opens.
+        self._last_dir = os.path.expanduser("~")
+        # Document span of each rendered segment, indexed by block number (see _index_segment_positions).
+        self._id_to_index = {}
+        self._doc_start = np.empty(0, dtype=np.int32)
+        self._doc_end = np.empty(0, dtype=np.int32)
+        # Playback spans of the timestamped segments, for the per-tick highlight lookup.
+        self._ts_ids = []
+        self._ts_start = np.empty(0)
+        self._ts_end = np.empty(0)
+        self._ts_disjoint = True
 
         self.selected_segment_id = None
         self.current_highlighted_segment_id = None
@@ -58,8 +129,8 @@ class CorrectionViewLogic(QObject):
             self.main_window.correction_forward_btn: "correction_forward_btn",
             self.timeline: "correction_timeline_frame",
             self.main_window.correction_time_label: "correction_time_label",
-            self.main_window.findChild(QPushButton, "Undo_button"): "Undo_button",
-            self.main_window.findChild(QPushButton, "Redo_Button"): "Redo_Button",
+            self.main_window.undo_button: "Undo_button",
+            self.main_window.redo_button: "Redo_Button",
             self.main_window.edit_speaker_btn: "edit_speaker_btn",
             self.main_window.correction_text_edit_btn: "correction_text_edit_btn",
             self.main_window.correction_timestamp_edit_btn: "correction_timestamp_edit_btn",
@@ -92,7 +163,7 @@ class CorrectionViewLogic(QObject):
     def connect_audio_player_signals(self):
         self.audio_player.progress.connect(self.update_audio_progress)
         self.audio_player.finished.connect(self.on_audio_finished)
-        self.audio_player.error.connect(lambda msg: QMessageBox.critical(self.main_window, "Audio Player Error", msg))
+        self.audio_player.error.connect(self._on_audio_error)
         self.audio_player.state_changed.connect(self.update_play_button_state)
 
     def connect_signals(self):
@@ -100,10 +171,10 @@ class CorrectionViewLogic(QObject):
         if textarea:
             textarea.segment_clicked.connect(self.on_segment_clicked)
             textarea.edit_requested.connect(self.on_edit_requested)
-            textarea.edit_cancelled.connect(lambda: self.exit_edit_mode(save=False))
+            textarea.edit_cancelled.connect(self._on_edit_cancelled)
             
-        self.main_window.findChild(QPushButton, "Undo_button").clicked.connect(self.undo_manager.undo)
-        self.main_window.findChild(QPushButton, "Redo_Button").clicked.connect(self.undo_manager.redo)
+        self.main_window.undo_button.clicked.connect(self.undo_manager.undo)
+        self.main_window.redo_button.clicked.connect(self.undo_manager.redo)
         self.undo_manager.state_changed.connect(self._update_undo_redo_buttons_state)
         self.undo_manager.history_changed.connect(self.render_segments_to_textarea)
         
@@ -121,18 +192,27 @@ class CorrectionViewLogic(QObject):
         self.main_window.correction_save_changes_btn.clicked.connect(self.save_changes)
         self.main_window.change_highlight_color_btn.clicked.connect(self.open_change_highlight_color_dialog)
         self.main_window.correction_play_pause_btn.clicked.connect(self.toggle_play_pause)
-        self.main_window.correction_rewind_btn.clicked.connect(lambda: self.on_seek_button_clicked(is_forward=False))
-        self.main_window.correction_forward_btn.clicked.connect(lambda: self.on_seek_button_clicked(is_forward=True))
+        self.main_window.correction_rewind_btn.clicked.connect(self._on_rewind_clicked)
+        self.main_window.correction_forward_btn.clicked.connect(self._on_forward_clicked)
         self.timeline.seek_requested.connect(self.seek_to_percentage)
         self.timeline.bar_dragged.connect(self.on_timestamp_bar_dragged)
         self.main_window.text_font_combo.currentTextChanged.connect(self._update_text_area_font)
         self.main_window.font_size_combo.currentTextChanged.connect(self._update_text_area_font)
         self.connect_audio_player_signals()
         
+    @Slot(str)
+    def _on_audio_error(self, msg): QMessageBox.critical(self.main_window, "Audio Player Error", msg)
+    @Slot()
+    def _on_edit_cancelled(self): self.exit_edit_mode(save=False)
+    @Slot()
+    def _on_rewind_clicked(self): self.on_seek_button_clicked(is_forward=False)
+    @Slot()
+    def _on_forward_clicked(self): self.on_seek_button_clicked(is_forward=True)
+
     @Slot(bool, bool)
     def _update_undo_redo_buttons_state(self, can_undo, can_redo):
-        self.main_window.findChild(QPushButton, "Undo_button").setEnabled(can_undo)
-        self.main_window.findChild(QPushButton, "Redo_Button").setEnabled(can_redo)
+        self.main_window.undo_button.setEnabled(can_undo)
+        self.main_window.redo_button.setEnabled(can_redo)
         
     def _execute_command(self, before_segments, before_map, action_func):
         action_func()
@@ -160,19 +240,44 @@ class CorrectionViewLogic(QObject):
 
     def _load_files_action(self):
         txt = self.main_window.correction_transcription_entry.text(); audio = self.main_window.correction_audio_entry.text()
-        if not txt or not audio: return
+        if not txt or not audio or self._loading: return
+        self.undo_manager.clear()
+        self.select_segment(None)
+        self.audio_player.reset()
+        # Reading the transcript and decoding/resampling the media run on the thread pool; the results come back in _on_files_loaded.
+        self._loading = True
+        self.segment_manager.clear_segments(); self._index_segment_positions()
+        self.set_controls_enabled(False)
+        self.main_window.correction_load_files_btn.setEnabled(False)
+        self.main_window.correction_text_area.setPlainText("Loading...")
+        task = _FileTask(_read_transcription_and_media, txt, audio)
+        task.signals.done.connect(self._on_files_loaded)
+        task.signals.error.connect(self._on_files_load_failed)
+        QThreadPool.globalInstance().start(task)
+
+    @Slot(object)
+    def _on_files_loaded(self, result):
+        self._loading = False
+        self.main_window.correction_load_files_btn.setEnabled(True)
+        lines, decoded = result
         try:
-            self.undo_manager.clear()
-            self.select_segment(None)
-            if self.audio_player: self.audio_player.destroy()
-            self.audio_player = AudioPlayer(); self.connect_audio_player_signals()
-            with open(txt, 'r', encoding='utf-8') as f: lines = f.readlines()
             self.segment_manager.parse_transcription_lines(lines); self.render_segments_to_textarea()
-            if not self.audio_player.load_file(audio): raise IOError("Audio player failed to load file.")
+            self.audio_player.load_decoded(decoded)
             self.timeline.set_waveform_data(self.audio_player.get_normalized_waveform()); self.timeline.set_duration(self.audio_player.get_duration())
+            if hasattr(self.main_window, 'monospace_font'):
+                self.main_window.correction_time_label.setFont(self.main_window.monospace_font)
+            self._last_progress_time = -1.0
             self.update_audio_progress(0); self.set_controls_enabled(True); self.update_play_button_state(playing=False)
         except Exception as e:
-            logger.exception("Load error."); self.set_controls_enabled(False); QMessageBox.critical(self.main_window, "Load Error", str(e))
+            logger.exception("Load error."); self._on_files_load_failed(str(e))
+
+    @Slot(str)
+    def _on_files_load_failed(self, message):
+        self._loading = False
+        self.main_window.correction_load_files_btn.setEnabled(True)
+        self.set_controls_enabled(False)
+        if not self.segment_manager.segments: self.main_window.correction_text_area.setPlainText("No segments loaded.")
+        QMessageBox.critical(self.main_window, "Load Error", message)
     
     @Slot()
     def on_delete_segment_clicked(self):
@@ -202,7 +307,7 @@ class CorrectionViewLogic(QObject):
             self.exit_all_edit_modes() # Safe to call here now.
             target_ids = self.multi_selection_ids if self.multi_selection_ids else ([self.selected_segment_id] if self.selected_segment_id else [])
             if target_ids and QMessageBox.question(self.main_window, "Confirm Delete", f"Are you sure you want to delete {len(target_ids)} segment(s)?") == QMessageBox.Yes:
-                for seg_id in sorted(target_ids, key=self.segment_manager.get_segment_index, reverse=True):
+                for seg_id in sorted(target_ids, key=self._idx, reverse=True):
                     self.segment_manager.remove_segment(seg_id)
                 self._clear_all_selections()
                 confirmed_action = True
@@ -223,7 +328,7 @@ class CorrectionViewLogic(QObject):
             if not original_segment or 'component_positions' not in original_segment or 'text' not in original_segment['component_positions']: return
             
             cursor = self.main_window.correction_text_area.textCursor(); absolute_cursor_pos = cursor.position()
-            self.segment_manager.update_segment_from_full_line(self.editing_segment_id, self.main_window.correction_text_area.document().findBlockByNumber(self.segment_manager.get_segment_index(self.editing_segment_id)).text())
+            self.segment_manager.update_segment_from_full_line(self.editing_segment_id, self._block(self._idx(self.editing_segment_id)).text())
             text_start_pos = original_segment['component_positions']['text'][0]; split_pos = max(0, absolute_cursor_pos - text_start_pos)
             
             defaults = {"speaker_raw": original_segment.get("speaker_raw"), "has_timestamps": original_segment.get("has_timestamps"), "has_explicit_end_time": original_segment.get("has_explicit_end_time", False)}
@@ -248,7 +353,7 @@ class CorrectionViewLogic(QObject):
     def _open_add_split_dialog(self, is_split_mode, defaults={}):
         dialog = QDialog(self.main_window); dialog.setWindowTitle("Split Segment" if is_split_mode else "Add New Segment"); layout = QGridLayout(dialog);
         layout.addWidget(QLabel("New Segment Speaker:"), 0, 0); speaker_combo = QComboBox(); speaker_map = {constants.NO_SPEAKER_LABEL: "(No Speaker)"}
-        speaker_map.update({spk: self.segment_manager.speaker_map.get(spk, spk) for spk in sorted(self.segment_manager.unique_speaker_labels)})
+        speaker_map.update({spk: self.segment_manager.speaker_map.get(spk, spk) for spk in self.segment_manager.unique_speaker_labels})
         for raw_id, display_name in speaker_map.items(): speaker_combo.addItem(display_name, raw_id)
         default_speaker = defaults.get('speaker_raw', constants.NO_SPEAKER_LABEL)
         speaker_combo.setCurrentIndex(speaker_combo.findData(default_speaker)); layout.addWidget(speaker_combo, 0, 1)
@@ -268,55 +373,66 @@ class CorrectionViewLogic(QObject):
             return result
         return None
         
+    @Slot()
     def render_segments_to_textarea(self):
         current_selection_id = self.selected_segment_id
         current_multi_ids = list(self.multi_selection_ids)
         
-        self.main_window.correction_text_area.clear()
         self.current_highlighted_segment_id = None
         
         if not self.segment_manager.segments: 
             self.main_window.correction_text_area.setPlainText("No segments loaded.")
+            self._index_segment_positions()
             return
 
-        cursor = QTextCursor(self.main_window.correction_text_area.document())
+        # The whole document is built as one string and set at once; positions are worked out alongside it.
+        parts = []; pos = 0
         for seg in self.segment_manager.segments:
-            seg['doc_positions'] = (cursor.position(), )
-            seg['component_positions'] = {}
+            seg_start = pos
+            components = {}
 
             if seg.get("has_timestamps"):
-                ts_start_pos = cursor.position()
                 ts_str = f"[{self.segment_manager.seconds_to_time_str(seg['start_time'])}] "
                 if seg.get('has_explicit_end_time') and seg.get('end_time') is not None:
                      ts_str = f"[{self.segment_manager.seconds_to_time_str(seg['start_time'])} - {self.segment_manager.seconds_to_time_str(seg['end_time'])}] "
-                cursor.insertText(ts_str, self.normal_format)
-                seg['component_positions']['timestamp'] = (ts_start_pos, cursor.position())
+                parts.append(ts_str); components['timestamp'] = (pos, pos + _doc_len(ts_str)); pos = components['timestamp'][1]
 
             speaker_label = seg.get("speaker_raw", constants.NO_SPEAKER_LABEL)
             if speaker_label != constants.NO_SPEAKER_LABEL:
-                spk_start_pos = cursor.position()
                 spk_str = f"{self.segment_manager.speaker_map.get(speaker_label, speaker_label)}: "
-                cursor.insertText(spk_str, self.normal_format)
-                seg['component_positions']['speaker'] = (spk_start_pos, cursor.position())
+                parts.append(spk_str); components['speaker'] = (pos, pos + _doc_len(spk_str)); pos = components['speaker'][1]
             
-            text_start_pos = cursor.position()
-            cursor.insertText(seg['text'], self.normal_format)
-            seg['component_positions']['text'] = (text_start_pos, cursor.position())
+            parts.append(seg['text']); components['text'] = (pos, pos + _doc_len(seg['text'])); pos = components['text'][1]
 
-            cursor.insertText('\n', self.normal_format)
-            seg['doc_positions'] = (seg['doc_positions'][0], cursor.position())
+            parts.append('\n'); pos += 1
+            seg['doc_positions'] = (seg_start, pos)
+            seg['component_positions'] = components
+        self.main_window.correction_text_area.setPlainText(''.join(parts))
+        self._index_segment_positions()
         
-        self._clear_all_selections(update_buttons=False)
+        # The new document is unformatted, so dropping the selection state is all the clearing needed.
+        self.selected_segment_id = None
+        self.multi_selection_ids.clear()
         if current_selection_id and self.segment_manager.get_segment_by_id(current_selection_id):
              self.select_segment(current_selection_id)
         if current_multi_ids:
             self.multi_selection_ids = [mid for mid in current_multi_ids if self.segment_manager.get_segment_by_id(mid)]
-            for mid in self.multi_selection_ids:
-                self._apply_format(mid, self.multi_selection_format)
+            self._apply_formats(self.multi_selection_ids, self.multi_selection_format)
         
         self.update_edit_buttons_state()
             
     def update_edit_buttons_state(self):
+        """Schedules a refresh of the edit buttons; several requests within one event-loop pass are applied once."""
+        if not self._btn_refresh_pending:
+            self._btn_refresh_pending = True
+            QTimer.singleShot(0, self._flush_edit_buttons_state)
+
+    @Slot()
+    def _flush_edit_buttons_state(self):
+        if self._btn_refresh_pending: self._refresh_edit_buttons_state()
+
+    def _refresh_edit_buttons_state(self):
+        self._btn_refresh_pending = False
         is_text_editing = self.editing_segment_id is not None
         is_ts_editing = self.timestamp_editing_segment_id is not None
         is_selected = self.selected_segment_id is not None
@@ -326,7 +442,7 @@ class CorrectionViewLogic(QObject):
             is_text_editing or is_ts_editing or is_selected or is_multi_selected
         )
         self.main_window.segment_btn.setEnabled(is_text_editing or is_selected)
-        self.main_window.merge_segments_btn.setEnabled(len(self.multi_selection_ids) > 1 or (is_selected and self.segment_manager.get_segment_index(self.selected_segment_id) > 0))
+        self.main_window.merge_segments_btn.setEnabled(len(self.multi_selection_ids) > 1 or (is_selected and self._idx(self.selected_segment_id) > 0))
         edit_button = self.main_window.correction_text_edit_btn
         if edit_button:
             edit_button.setEnabled((is_selected or is_text_editing) and not is_ts_editing)
@@ -399,7 +515,7 @@ class CorrectionViewLogic(QObject):
         is_shift_pressed = (modifiers & Qt.KeyboardModifier.ShiftModifier) == Qt.KeyboardModifier.ShiftModifier
         if is_shift_pressed:
             if self.selected_segment_id and self.selected_segment_id != segment_id:
-                 start_index = self.segment_manager.get_segment_index(self.selected_segment_id)
+                 start_index = self._idx(self.selected_segment_id)
                  end_index = block_number
                  if start_index > end_index: start_index, end_index = end_index, start_index
                  
@@ -407,7 +523,7 @@ class CorrectionViewLogic(QObject):
                  
                  self._clear_all_selections(update_buttons=False)
                  self.multi_selection_ids = new_multi_ids
-                 for sid in self.multi_selection_ids: self._apply_format(sid, self.multi_selection_format)
+                 self._apply_formats(self.multi_selection_ids, self.multi_selection_format)
 
             elif segment_id not in self.multi_selection_ids:
                  self.multi_selection_ids.append(segment_id)
@@ -424,11 +540,16 @@ class CorrectionViewLogic(QObject):
         self.update_edit_buttons_state()
 
     def _clear_all_selections(self, update_buttons=True):
-        self._clear_selection();
-        for seg_id in self.multi_selection_ids: 
-            if self.segment_manager.get_segment_by_id(seg_id):
-                self._apply_format(seg_id, self.normal_format)
-        self.multi_selection_ids.clear()
+        if len(self.multi_selection_ids) >= BULK_FORMAT_RESET_MIN:
+            # One document-wide format change is cheaper than many per-segment ones; only the playback highlight survives it.
+            self.selected_segment_id = None
+            self.multi_selection_ids.clear()
+            self._reset_all_formats()
+            if self.current_highlighted_segment_id: self._apply_highlight(self.current_highlighted_segment_id)
+        else:
+            self._clear_selection();
+            self._apply_formats(self.multi_selection_ids, self.normal_format)
+            self.multi_selection_ids.clear()
         if update_buttons: self.update_edit_buttons_state()
 
     @Slot()
@@ -447,7 +568,7 @@ class CorrectionViewLogic(QObject):
             if new_target_id: action_made = True
         elif self.selected_segment_id and num_multi_selected == 0:
             current_id = self.selected_segment_id
-            current_index = self.segment_manager.get_segment_index(current_id)
+            current_index = self._idx(current_id)
             if current_index > 0:
                 previous_id = self.segment_manager.segments[current_index - 1]['id']
                 if self.segment_manager.merge_segment_upwards(current_id):
@@ -470,15 +591,64 @@ class CorrectionViewLogic(QObject):
         if self.timestamp_editing_segment_id: self.exit_timestamp_edit_mode(save=False)
         elif self.selected_segment_id: self.enter_timestamp_edit_mode(self.selected_segment_id)
         
-    def _apply_format(self, segment_id, text_format, clear_first=False):
-        segment = self.segment_manager.get_segment_by_id(segment_id)
-        if segment and 'doc_positions' in segment:
-            cursor = QTextCursor(self.main_window.correction_text_area.document())
-            start, end = segment['doc_positions']
-            cursor.setPosition(start)
-            cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
-            cursor.movePosition(QTextCursor.MoveOperation.Left, QTextCursor.MoveMode.KeepAnchor, 1) # Exclude newline
-            cursor.setCharFormat(text_format)
+    def _index_segment_positions(self):
+        """Snapshots the rendered segments' document spans so formatting a segment is a dict hit plus two array reads."""
+        segs = self.segment_manager.segments
+        self._id_to_index = {s['id']: i for i, s in enumerate(segs)}
+        self._doc_start = np.fromiter((s['doc_positions'][0] for s in segs), dtype=np.int32, count=len(segs))
+        self._doc_end = np.fromiter((s['doc_positions'][1] for s in segs), dtype=np.int32, count=len(segs))
+
+        ids, starts, ends = [], [], []
+        for i, seg in enumerate(segs):
+            if not seg.get("has_timestamps"): continue
+            end_time = seg.get('end_time')
+            if end_time is None:
+                # Open-ended segments run to the next timestamped segment, or to the end of the audio (inf).
+                next_seg = segs[i + 1] if i + 1 < len(segs) else None
+                end_time = next_seg.get('start_time') if next_seg is not None and next_seg.get('has_timestamps') else np.inf
+            ids.append(seg['id']); starts.append(seg.get('start_time', -1)); ends.append(end_time)
+        self._ts_ids = ids
+        self._ts_start = np.asarray(starts, dtype=np.float64)
+        self._ts_end = np.asarray(ends, dtype=np.float64)
+        # Chronological, non-overlapping spans (the normal case) can be binary-searched on every tick.
+        self._ts_disjoint = bool(np.all(np.diff(self._ts_start) >= 0) and np.all(self._ts_end[:-1] <= self._ts_start[1:]))
+
+    def _idx(self, segment_id):
+        """Block number of a segment: from the last render, or by scanning for segments added since."""
+        idx = self._id_to_index.get(segment_id)
+        return idx if idx is not None else self.segment_manager.get_segment_index(segment_id)
+
+    def _block(self, block_number):
+        """
+        Text block of a segment, found from its rendered start position. Typing in the segment being
+        edited shifts the blocks after it, so those fall back to a lookup by number.
+        """
+        document = self.main_window.correction_text_area.document()
+        if 0 <= block_number < len(self._doc_start) and (self.editing_segment_id is None or block_number <= self._idx(self.editing_segment_id)):
+            return document.findBlock(int(self._doc_start[block_number]))
+        return document.findBlockByNumber(block_number)
+
+    def _apply_format(self, segment_id, text_format, clear_first=False, cursor=None):
+        # Spans are those of the last render, which is what the document currently shows.
+        idx = self._id_to_index.get(segment_id)
+        if idx is None: return
+        if cursor is None: cursor = QTextCursor(self.main_window.correction_text_area.document())
+        cursor.setPosition(int(self._doc_start[idx]))
+        cursor.setPosition(int(self._doc_end[idx]) - 1, QTextCursor.MoveMode.KeepAnchor) # Exclude newline
+        cursor.setCharFormat(text_format)
+
+    def _reset_all_formats(self):
+        cursor = QTextCursor(self.main_window.correction_text_area.document())
+        cursor.select(QTextCursor.SelectionType.Document)
+        cursor.setCharFormat(self.normal_format)
+
+    def _apply_formats(self, segment_ids, text_format):
+        """Formats several segments with one cursor inside a single edit block, so the layout is updated once."""
+        if not segment_ids: return
+        cursor = QTextCursor(self.main_window.correction_text_area.document())
+        cursor.beginEditBlock()
+        for segment_id in segment_ids: self._apply_format(segment_id, text_format, cursor=cursor)
+        cursor.endEditBlock()
             
     def set_highlight_color(self, color): self.highlight_format.setBackground(color); self.selection_format.setBackground(color.darker(150)); self.multi_selection_format.setBackground(color.lighter(130))
     def _apply_selection(self, segment_id): self._apply_format(segment_id, self.selection_format)
@@ -544,7 +714,7 @@ class CorrectionViewLogic(QObject):
         
         combo = QComboBox()
         combo.addItem("(No Speaker)", constants.NO_SPEAKER_LABEL)
-        for speaker_id in sorted(list(self.segment_manager.unique_speaker_labels)): 
+        for speaker_id in self.segment_manager.unique_speaker_labels: 
             display_name = self.segment_manager.speaker_map.get(speaker_id, speaker_id)
             combo.addItem(f"{display_name} ({speaker_id})", speaker_id)
         layout.addWidget(combo, 1, 0, 1, 2)
@@ -583,7 +753,7 @@ class CorrectionViewLogic(QObject):
     def on_edit_requested(self, block_number, position_in_block):
         if not (0 <= block_number < len(self.segment_manager.segments)): return
         segment = self.segment_manager.segments[block_number]
-        block = self.main_window.correction_text_area.document().findBlockByNumber(block_number); absolute_click_pos = block.position() + position_in_block
+        block = self._block(block_number); absolute_click_pos = block.position() + position_in_block
         if 'component_positions' in segment:
             positions = segment['component_positions']
             if 'speaker' in positions and positions['speaker'][0] <= absolute_click_pos < positions['speaker'][1]:
@@ -607,11 +777,11 @@ class CorrectionViewLogic(QObject):
         self.original_text_before_edit = segment_obj.get('text')
         self.editing_segment_id = segment_id
         
-        block_number = self.segment_manager.get_segment_index(segment_id)
+        block_number = self._idx(segment_id)
         if block_number == -1: return
 
         if segment_obj.get('text') == constants.EMPTY_SEGMENT_PLACEHOLDER:
-            block = self.main_window.correction_text_area.document().findBlockByNumber(block_number)
+            block = self._block(block_number)
             if block.isValid() and 'text' in segment_obj.get('component_positions', {}):
                 text_start, text_end = segment_obj['component_positions']['text']
                 cursor = QTextCursor(block)
@@ -633,9 +803,9 @@ class CorrectionViewLogic(QObject):
             before_segs = deepcopy(self.segment_manager.segments)
             before_map = deepcopy(self.segment_manager.speaker_map)
             
-            block_number = self.segment_manager.get_segment_index(segment_id_to_exit)
+            block_number = self._idx(segment_id_to_exit)
             if block_number != -1: 
-                line_text = self.main_window.correction_text_area.document().findBlockByNumber(block_number).text()
+                line_text = self._block(block_number).text()
                 self.segment_manager.update_segment_from_full_line(segment_id_to_exit, line_text)
 
             segment_after_update = self.segment_manager.get_segment_by_id(segment_id_to_exit)
@@ -702,33 +872,32 @@ class CorrectionViewLogic(QObject):
     def _save_changes_action(self):
         if not self.segment_manager.segments: return
         self.undo_manager.clear()
-        path, _=QFileDialog.getSaveFileName(self.main_window, "Save Corrected Transcription", "", "Text Files (*.txt)");
+        path, _=QFileDialog.getSaveFileName(self.main_window, "Save Corrected Transcription", self._last_dir, "Text Files (*.txt)");
         if path:
-            try:
-                save_data = self.segment_manager.format_segments_for_saving(True, True)
-                with open(path, 'w', encoding='utf-8') as f: 
-                    f.write('\n'.join(save_data))
-                QMessageBox.information(self.main_window, "Saved", f"Transcription saved to {path}")
-            except IOError as e: QMessageBox.critical(self.main_window, "Save Error", f"Could not save file: {e}")
+            self._last_dir = os.path.dirname(path)
+            # Formatting reads the live segments, so it stays here; only the write goes to the thread pool.
+            save_data = self.segment_manager.format_segments_for_saving(True, True)
+            task = _FileTask(_write_lines, path, save_data)
+            task.signals.done.connect(self._on_changes_saved)
+            task.signals.error.connect(self._on_changes_save_failed)
+            QThreadPool.globalInstance().start(task)
+
+    @Slot(object)
+    def _on_changes_saved(self, path): QMessageBox.information(self.main_window, "Saved", f"Transcription saved to {path}")
+    @Slot(str)
+    def _on_changes_save_failed(self, message): QMessageBox.critical(self.main_window, "Save Error", f"Could not save file: {message}")
             
     @Slot()
     def browse_transcription_file(self): self._safe_action(self._browse_transcription_file_action)
     def _browse_transcription_file_action(self):
-        path, _ = QFileDialog.getOpenFileName(self.main_window, "Select Transcription", "", "Text (*.txt)");
-        if path: self.main_window.correction_transcription_entry.setText(path)
+        path, _ = QFileDialog.getOpenFileName(self.main_window, "Select Transcription", self._last_dir, "Text (*.txt)");
+        if path: self._last_dir = os.path.dirname(path); self.main_window.correction_transcription_entry.setText(path)
         
     @Slot()
     def browse_audio_file(self): self._safe_action(self._browse_audio_file_action)
     def _browse_audio_file_action(self):
-        # --- THE FIX ---
-        file_filter = (
-            "All Media Files (*.wav *.mp3 *.aac *.flac *.m4a *.mp4 *.mov *.avi *.mkv);;"
-            "Audio Files (*.wav *.mp3 *.aac *.flac *.m4a);;"
-            "Video Files (*.mp4 *.mov *.avi *.mkv);;"
-            "All Files (*)"
-        )
-        path, _ = QFileDialog.getOpenFileName(self.main_window, "Select Audio or Video File", "", file_filter);
-        if path: self.main_window.correction_audio_entry.setText(path)
+        path, _ = QFileDialog.getOpenFileName(self.main_window, "Select Audio or Video File", self._last_dir, constants.MEDIA_FILE_FILTER);
+        if path: self._last_dir = os.path.dirname(path); self.main_window.correction_audio_entry.setText(path)
         
     @Slot()
     def open_speaker_assignment_dialog(self): self._safe_action(self._open_speaker_assignment_dialog_action)
@@ -739,13 +908,11 @@ class CorrectionViewLogic(QObject):
         before_segs = deepcopy(self.segment_manager.segments)
         before_map = deepcopy(self.segment_manager.speaker_map)
         
-        dialog=QDialog(self.main_window); dialog.setWindowTitle("Assign Speaker Names"); dialog.setMinimumWidth(400); layout=QVBoxLayout(dialog); scroll=QScrollArea(); scroll.setWidgetResizable(True); layout.addWidget(scroll); content=QWidget(); form=QGridLayout(content); entries={}
-        for i, label in enumerate(sorted(list(self.segment_manager.unique_speaker_labels))):
-            form.addWidget(QLabel(f"<b>{label}:</b>"), i, 0); edit=QLineEdit(self.segment_manager.speaker_map.get(label, "")); form.addWidget(edit, i, 1); entries[label]=edit
-        sep_row=len(entries); form.addWidget(QLabel("---<br><b>Add New</b>"), sep_row, 0, 1, 2, Qt.AlignCenter); form.addWidget(QLabel("ID:"), sep_row + 1, 0); id_edit=QLineEdit(); form.addWidget(id_edit, sep_row + 1, 1); form.addWidget(QLabel("Name:"), sep_row + 2, 0); name_edit=QLineEdit(); form.addWidget(name_edit, sep_row + 2, 1)
-        scroll.setWidget(content); buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel); buttons.accepted.connect(dialog.accept); buttons.rejected.connect(dialog.reject); layout.addWidget(buttons)
+        if self._spk_dialog is None: self._build_speaker_assignment_dialog()
+        self._sync_speaker_assignment_rows()
+        entries, id_edit, name_edit = self._spk_entries, self._spk_id_edit, self._spk_name_edit
         
-        if dialog.exec() == QDialog.Accepted:
+        if self._spk_dialog.exec() == QDialog.Accepted:
             def action():
                 for label, edit in entries.items():
                     if edit.text().strip(): self.segment_manager.speaker_map[label]=edit.text().strip()
@@ -759,6 +926,27 @@ class CorrectionViewLogic(QObject):
             
             self._execute_command(before_segs, before_map, action)
 
+    def _build_speaker_assignment_dialog(self):
+        """Builds the speaker-name dialog once; later opens only refresh its rows (see _sync_speaker_assignment_rows)."""
+        dialog=QDialog(self.main_window); dialog.setWindowTitle("Assign Speaker Names"); dialog.setMinimumWidth(400); layout=QVBoxLayout(dialog); scroll=QScrollArea(); scroll.setWidgetResizable(True); layout.addWidget(scroll); content=QWidget(); content_layout=QVBoxLayout(content)
+        self._spk_form=QGridLayout(); content_layout.addLayout(self._spk_form); add_form=QGridLayout(); content_layout.addLayout(add_form)
+        add_form.addWidget(QLabel("---<br><b>Add New</b>"), 0, 0, 1, 2, Qt.AlignCenter); add_form.addWidget(QLabel("ID:"), 1, 0); self._spk_id_edit=QLineEdit(); add_form.addWidget(self._spk_id_edit, 1, 1); add_form.addWidget(QLabel("Name:"), 2, 0); self._spk_name_edit=QLineEdit(); add_form.addWidget(self._spk_name_edit, 2, 1)
+        scroll.setWidget(content); buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel); buttons.accepted.connect(dialog.accept); buttons.rejected.connect(dialog.reject); layout.addWidget(buttons)
+        self._spk_dialog = dialog; self._spk_entries = {}
+
+    def _sync_speaker_assignment_rows(self):
+        labels = list(self.segment_manager.unique_speaker_labels)
+        if labels != list(self._spk_entries):
+            # The speaker set changed (another file, or a speaker added here), so the label rows are rebuilt.
+            while self._spk_form.count():
+                item = self._spk_form.takeAt(0)
+                if item.widget(): item.widget().deleteLater()
+            self._spk_entries = {}
+            for i, label in enumerate(labels):
+                self._spk_form.addWidget(QLabel(f"<b>{label}:</b>"), i, 0); edit=QLineEdit(); self._spk_form.addWidget(edit, i, 1); self._spk_entries[label]=edit
+        for label, edit in self._spk_entries.items(): edit.setText(self.segment_manager.speaker_map.get(label, ""))
+        self._spk_id_edit.clear(); self._spk_name_edit.clear()
+
     @Slot()
     def open_change_highlight_color_dialog(self): self._safe_action(self._open_change_highlight_color_dialog_action)
     def _open_change_highlight_color_dialog_action(self):
@@ -776,8 +964,10 @@ class CorrectionViewLogic(QObject):
                         self.main_window.delete_segment_btn, self.main_window.segment_btn, 
                         self.main_window.merge_segments_btn]:
                  if btn: btn.setEnabled(False)
+            # Drop any queued refresh, which would re-enable buttons on the disabled view.
+            self._btn_refresh_pending = False
         else:
-             self.update_edit_buttons_state()
+             self._refresh_edit_buttons_state()
              
     @Slot(bool)
     def update_play_button_state(self, playing):
@@ -786,6 +976,9 @@ class CorrectionViewLogic(QObject):
         
     @Slot()
     def on_audio_finished(self): 
+        # The last ticks may have been throttled away; show the final position.
+        self._last_progress_time = -1.0
+        self.update_audio_progress(self.audio_player.get_duration())
         self._clear_highlight(); 
         self.current_highlighted_segment_id=None
         if self.selected_segment_id:
@@ -793,32 +986,26 @@ class CorrectionViewLogic(QObject):
 
     @Slot(float)
     def update_audio_progress(self, current_time):
+        # The player reports every audio chunk (~43 Hz); seeks always pass since they move further than the step.
+        if abs(current_time - self._last_progress_time) < PROGRESS_MIN_STEP: return
+        self._last_progress_time = current_time
         duration = self.audio_player.get_duration()
         if duration > 0:
-            self.main_window.correction_time_label.setText(f"{self.format_time(current_time)} / {self.format_time(duration)}")
-            if hasattr(self.main_window, 'monospace_font'):
-                self.main_window.correction_time_label.setFont(self.main_window.monospace_font)
+            if self._duration_label[0] != duration: self._duration_label = (duration, self.format_time(duration))
+            self.main_window.correction_time_label.setText(f"{self.format_time(current_time)} / {self._duration_label[1]}")
             self.timeline.set_progress(current_time)
             self._update_text_highlight(current_time)
 
     def _update_text_highlight(self, current_time):
         active_id = None
-        if self.audio_player.get_duration() > 0:
-            for i, seg in enumerate(self.segment_manager.segments):
-                if not seg.get("has_timestamps"): continue
-                start_time=seg.get('start_time', -1)
-                
-                end_time = seg.get('end_time')
-                if end_time is None:
-                    is_last_segment = (i + 1) >= len(self.segment_manager.segments)
-                    if not is_last_segment and self.segment_manager.segments[i + 1].get('has_timestamps'):
-                        end_time = self.segment_manager.segments[i+1].get('start_time')
-                    else:
-                        end_time = self.audio_player.get_duration()
-                
-                if end_time is not None and start_time <= current_time < end_time:
-                    active_id = seg['id']
-                    break
+        if self.audio_player.get_duration() > 0 and self._ts_ids:
+            if self._ts_disjoint:
+                i = int(np.searchsorted(self._ts_start, current_time, side='right')) - 1
+                if i >= 0 and current_time < self._ts_end[i]: active_id = self._ts_ids[i]
+            else:
+                # Out-of-order or overlapping timestamps: first segment (in document order) containing the time.
+                hits = np.flatnonzero((self._ts_start <= current_time) & (current_time < self._ts_end))
+                if hits.size: active_id = self._ts_ids[hits[0]]
 
         if self.current_highlighted_segment_id != active_id:
             old_highlight_id = self.current_highlighted_segment_id
@@ -834,7 +1021,7 @@ class CorrectionViewLogic(QObject):
             if active_id:
                 self._apply_highlight(active_id)
     
-    @Slot()
+    @Slot(float)
     def seek_by_offset(self, offset_seconds): self.audio_player.seek(offset_seconds)
     @Slot(float)
     def seek_to_percentage(self, percentage):
@@ -854,5 +1041,5 @@ class CorrectionViewLogic(QObject):
         # Now, call the existing load function which reads from the line edits
         self.load_files()
     def format_time(self, seconds): 
-        m, s = divmod(abs(seconds), 60)
-        return f"{int(m):02d}:{s:06.3f}"
\ No newline at end of file
+        # Millisecond resolution is all the label shows, so formatted values are cached per millisecond.
+        return _format_ms(round(abs(seconds) * 1000))
\ No newline at end of file
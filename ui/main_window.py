@@ -245,7 +245,7 @@
               </property>
               <layout class="QVBoxLayout" name="verticalLayout_8">
                <item>
-                <widget class="QTextEdit" name="output_text_area"/>
+                <widget class="QPlainTextEdit" name="output_text_area"/>
                </item>
                <item>
                 <widget class="QPushButton" name="correction_button">
@@ -48,6 +48,25 @@ STATUS_ERROR = "ERROR"
 # --- Default output file name ---
 DEFAULT_OUTPUT_TEXT_FILE = "processed_output.txt" 
 DEFAULT_CONFIG_FILE = os.path.join(APP_USER_DATA_DIR, 'config.ini')
+# Conditional-request cache (ETag / Last-Modified + body) for the GitHub "latest release" check.
+UPDATE_CACHE_FILE = os.path.join(os.path.expanduser('~'), 'AutoVerse_Cache', 'update_cache.json')
+
+# --- Media files ---
+AUDIO_EXTENSIONS = frozenset({'.wav', '.mp3', '.aac', '.flac', '.m4a'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mkv', '.avi', '.mov', '.flv', '.wmv'})
+_AUDIO_PATTERNS = " ".join(f"*{ext}" for ext in sorted(AUDIO_EXTENSIONS))
+_VIDEO_PATTERNS = " ".join(f"*{ext}" for ext in sorted(VIDEO_EXTENSIONS))
+MEDIA_FILE_FILTER = (
+    f"All Media Files ({_AUDIO_PATTERNS} {_VIDEO_PATTERNS});;"
+    f"Audio Files ({_AUDIO_PATTERNS});;"
+    f"Video Files ({_VIDEO_PATTERNS});;"
+    "All Files (*)"
+)
+
+# --- Combo box choices ---
+MODEL_CHOICES = ("tiny", "base", "small", "medium", "large (recommended)", "turbo")
+DEFAULT_MODEL_CHOICE = "large (recommended)"
+FONT_SIZE_CHOICES = ("8", "9", "10", "11", "12", "14", "16", "18", "24", "36")
 
 # --- Special Labels ---
 NO_SPEAKER_LABEL = "SPEAKER_NONE_INTERNAL"